@@ -1,16 +1,20 @@
 """Command and callback handlers for the health bot."""
 
+import asyncio
+import functools
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import ContextTypes
-import pytz
+from telegram.error import TelegramError
+from telegram.ext import ApplicationHandlerStop, ContextTypes
 
 import config
 from bot.sheets import SheetsClient
 from bot.points import (
-    calculate_daily_points,
-    get_max_points_for_day,
+    daily_grand_total,
+    day_max_total,
     get_meal_type_by_time,
     is_exercise_day,
 )
@@ -23,10 +27,59 @@ from bot.messages import (
     format_milestone_message,
     format_daily_summary,
     format_meal_logged,
+    format_write_failed,
 )
 
 logger = logging.getLogger(__name__)
 
+_POINTS = config.POINTS
+
+# Milestone messages never change, so format them once
+_MILESTONE_PERFECT = format_milestone_message("perfect_day")
+_MILESTONE_HALFWAY = format_milestone_message("halfway")
+_MILESTONE_WATER = format_milestone_message("water_hard_mode")
+
+_WELCOME_TEXT = format_welcome_message()
+
+_HELP_TEXT = """📋 *Comandos Disponíveis*
+
+*Progresso:*
+/hoje - Ver progresso de hoje
+/semana - Ver resumo da semana
+
+*Registrar ações:*
+/feito <ação> - Registrar uma ação manualmente
+/desfazer <ação> - Desfazer uma ação
+
+*Ações disponíveis:*
+acordar, cardio, cafe, almoco, lanche, jantar,
+agua1, agua2, agua3, copo, quarto, dormir, pilates, academia
+
+*Refeições:*
+/refeicao <descrição> - Registrar refeição
+/besteira <descrição> - Registrar cheat meal
+
+*Água e Peso:*
+/agua - Ver status da água com botões
+/peso <kg> - Registrar peso (ou ver atual)
+
+*Academia:*
+/academia sexta - Definir academia para sexta
+/academia sabado - Definir academia para sábado
+
+*Administração:*
+/add_semana <data> [dia] - Adicionar semana
+/add_mes <data> - Adicionar mês
+/setup_sheets - Configurar planilhas
+
+*Exemplos:*
+• /feito academia
+• /feito cardio
+• /desfazer cafe
+• /refeicao ovos mexidos
+• /peso 75.5
+"""
+
 # Action names translation (internal -> Portuguese display)
 ACTION_NAMES_PT = {
     "wake_7am": "acordar",
@@ -48,28 +101,176 @@ ACTION_NAMES_PT = {
 # Reverse mapping (Portuguese -> internal)
 ACTION_NAMES_EN = {v: k for k, v in ACTION_NAMES_PT.items()}
 
+# Every accepted action input (PT or EN) -> internal action name
+_ALIAS_TO_CANONICAL = {**ACTION_NAMES_EN, **{k: k for k in ACTION_NAMES_PT}}
+
 # All valid action inputs (both PT and EN)
-VALID_ACTIONS = list(ACTION_NAMES_PT.keys()) + list(ACTION_NAMES_EN.keys())
+VALID_ACTIONS = frozenset(_ALIAS_TO_CANONICAL)
 
 
 def normalize_action(action: str) -> str:
     """Convert action name to internal format (English)."""
     action = action.lower()
-    if action in ACTION_NAMES_EN:
-        return ACTION_NAMES_EN[action]
-    return action
+    return _ALIAS_TO_CANONICAL.get(action, action)
+
+
+_ACTIONS_DISPLAY = ", ".join(ACTION_NAMES_PT.values())
 
 
 def get_actions_display() -> str:
     """Get formatted list of actions for display."""
-    return ", ".join(ACTION_NAMES_PT.values())
+    return _ACTIONS_DISPLAY
+
+
+# Usage messages for commands that take an action name
+UNDO_USAGE = f"Uso: /undo <ação>\nAções disponíveis: {get_actions_display()}"
+DONE_USAGE = f"Uso: /done <ação>\nAções disponíveis: {get_actions_display()}"
+
+# Reply templates, bound to str.format once
+_UNKNOWN_ACTION = (
+    "❌ Ação desconhecida: {action}\nAções disponíveis: " + get_actions_display()
+).format
+# Button presses carry an internal action name, so no list of aliases here
+_UNKNOWN_ACTION_REPLY = "❌ Ação desconhecida: {action}".format
+_ALREADY_DONE = "✓ {action} já registrado hoje!".format
+_UNDONE = "✓ Desfeito: {action}".format
+_GYM_OK = "✓ Dia da academia definido para {day_pt} nesta semana!".format
+_WEIGHT_CURRENT = "Peso atual: {weight} kg\n\nUso: /weight <kg>".format
+_WEIGHT_OK = "✓ Peso registrado: {weight} kg".format
+_WEEK_ADDED = "✓ Semana adicionada iniciando em {start_date}".format
+_MONTH_ADDED = "✓ Mês adicionado iniciando em {start_date}".format
+
+# Meal type (from get_meal_type_by_time) -> action marked when logging a meal
+MEAL_TYPE_ACTIONS = {"B": "breakfast", "L": "lunch", "S": "snack", "D": "dinner"}
+
+# Accepted /gym arguments (English + Portuguese) -> stored gym day
+GYM_DAY_INPUTS = {
+    "friday": "friday",
+    "sexta": "friday",
+    "saturday": "saturday",
+    "sabado": "saturday",
+    "sábado": "saturday",
+}
+
+# Stored gym day -> Portuguese display name
+GYM_DAY_NAMES_PT = {"friday": "Sexta", "saturday": "Sábado"}
 
 
+@functools.lru_cache(maxsize=1)
 def get_sheets_client() -> SheetsClient:
-    """Get or create sheets client."""
+    """Get the shared sheets client, creating it on first use.
+
+    Building a client re-authenticates with Google, so a single instance
+    is reused for every handler call.
+    """
     return SheetsClient()
 
 
+# Sheets calls run on their own bounded pool; each worker thread keeps one
+# authorized connection (see SheetsClient._build_request)
+_SHEETS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=config.SHEETS_MAX_CONNECTIONS, thread_name_prefix="sheets"
+)
+
+
+async def run_sheets(func, /, *args, **kwargs):
+    """Run a blocking SheetsClient call on the Sheets worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _SHEETS_EXECUTOR, functools.partial(func, *args, **kwargs)
+    )
+
+
+# Pending (date, row, action, value) writes, sent in batches by _write_flusher
+_WRITE_QUEUE: asyncio.Queue = asyncio.Queue()
+_FLUSHER_TASK: Optional[asyncio.Task] = None
+
+
+def queue_action_write(
+    sheets: SheetsClient, today_row: tuple[str, int], action: str, value: int
+) -> None:
+    """Record an action as pending in the client and queue its write to the sheet.
+
+    Args:
+        sheets: Shared sheets client
+        today_row: (date, row number) the action was confirmed against, so
+            a press just before midnight is not written to the next day
+        action: Validated internal action name
+        value: Value to write
+    """
+    day, row = today_row
+    sheets.queue_action(action, value, day)
+    _WRITE_QUEUE.put_nowait((day, row, action, value))
+
+
+async def _flush_writes(bot, batch: dict[tuple[str, int], dict[str, int]]) -> None:
+    """Write a batch of queued actions, one request per row.
+
+    Rows are removed from batch as they are sent, so if the flush is
+    cancelled, batch holds exactly the rows not yet sent. A write already
+    running finishes in its worker thread either way. If a write fails,
+    the user is told which actions were not saved.
+    """
+    sheets = get_sheets_client()
+    while batch:
+        (day, row), updates = batch.popitem()
+        try:
+            await run_sheets(sheets.update_actions, day, row, updates)
+        except Exception:
+            logger.exception("Writing %r to row %d failed", updates, row)
+            try:
+                await bot.send_message(
+                    chat_id=config.TELEGRAM_USER_ID,
+                    text=format_write_failed(list(updates), date.fromisoformat(day)),
+                )
+            except TelegramError:
+                logger.warning("Could not report the failed write", exc_info=True)
+
+
+async def _write_flusher(bot) -> None:
+    """Send queued action writes, coalescing each batch into one request."""
+    loop = asyncio.get_running_loop()
+    # (date, row) -> {action: value}
+    batch: dict[tuple[str, int], dict[str, int]] = {}
+    try:
+        while True:
+            day, row, action, value = await _WRITE_QUEUE.get()
+            batch.setdefault((day, row), {})[action] = value
+            ops = 1
+            deadline = loop.time() + config.SHEETS_WRITE_FLUSH_INTERVAL
+            while ops < config.SHEETS_WRITE_BATCH_SIZE:
+                try:
+                    day, row, action, value = await asyncio.wait_for(
+                        _WRITE_QUEUE.get(), deadline - loop.time()
+                    )
+                except asyncio.TimeoutError:
+                    break
+                batch.setdefault((day, row), {})[action] = value
+                ops += 1
+            await _flush_writes(bot, batch)
+    except asyncio.CancelledError:
+        # Send the rest of a flush cut short, plus whatever is still queued,
+        # so no press is lost on shutdown
+        while not _WRITE_QUEUE.empty():
+            day, row, action, value = _WRITE_QUEUE.get_nowait()
+            batch.setdefault((day, row), {})[action] = value
+        await _flush_writes(bot, batch)
+        raise
+
+
+async def start_write_flusher(application) -> None:
+    """Start the write queue flusher (Application post_init hook)."""
+    global _FLUSHER_TASK
+    _FLUSHER_TASK = asyncio.create_task(_write_flusher(application.bot))
+
+
+async def stop_write_flusher(application) -> None:
+    """Flush pending writes and stop the flusher (Application post_stop hook)."""
+    if _FLUSHER_TASK is not None:
+        _FLUSHER_TASK.cancel()
+        await asyncio.gather(_FLUSHER_TASK, return_exceptions=True)
+
+
 def is_authorized(user_id: int) -> bool:
     """Check if user is authorized to use the bot."""
     return user_id == config.TELEGRAM_USER_ID
@@ -77,78 +278,105 @@ def is_authorized(user_id: int) -> bool:
 
 async def unauthorized_response(update: Update) -> None:
     """Send unauthorized response."""
-    await update.message.reply_text("⛔ Não autorizado. Este bot é privado.")
+    if update.effective_message:
+        await update.effective_message.reply_text("⛔ Não autorizado. Este bot é privado.")
 
 
-# Command Handlers
+def require_auth(func):
+    """Decorator that rejects updates from anyone but the configured user."""
 
+    @functools.wraps(func)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        if not update.effective_user or not is_authorized(update.effective_user.id):
+            await unauthorized_response(update)
+            return
+        await func(update, context)
 
-async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle /start command."""
-    if not is_authorized(update.effective_user.id):
+    return wrapper
+
+
+async def auth_gate(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Stop unauthorized updates before any command or callback handler runs.
+
+    Registered in a handler group that runs before all others.
+    """
+    if not update.effective_user or not is_authorized(update.effective_user.id):
         await unauthorized_response(update)
+        raise ApplicationHandlerStop
+
+
+# Reply for each error class; anything else gets _DEFAULT_ERROR_REPLY
+_ERROR_REPLIES = {
+    ValueError: "❌ Valor inválido.",
+    TimeoutError: "❌ A planilha demorou a responder. Tente novamente.",
+}
+_DEFAULT_ERROR_REPLY = "❌ Erro ao processar o pedido. Tente novamente."
+
+
+async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Log an error raised by a handler and tell the user it failed.
+
+    Handlers let unexpected errors propagate here instead of catching them
+    one by one.
+    """
+    logger.error("Error while handling an update", exc_info=context.error)
+    if not isinstance(update, Update):
         return
 
-    await update.message.reply_text(format_welcome_message())
+    reply = next(
+        (_ERROR_REPLIES[cls] for cls in type(context.error).__mro__ if cls in _ERROR_REPLIES),
+        _DEFAULT_ERROR_REPLY,
+    )
+    if update.callback_query:
+        await update.callback_query.edit_message_text(reply)
+    elif update.effective_message:
+        await update.effective_message.reply_text(reply)
 
 
+# Command Handlers
+
+
+@require_auth
+async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle /start command."""
+    await update.message.reply_text(_WELCOME_TEXT)
+
+
+@require_auth
 async def today_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /today command - show today's progress."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
-    try:
-        sheets = get_sheets_client()
-        data = sheets.get_today_data()
-        gym_day = sheets.get_gym_day_choice()
-        message = format_today_progress(data, gym_day)
-        await update.message.reply_text(message)
-    except Exception as e:
-        logger.error(f"Error in today_command: {e}")
-        await update.message.reply_text("❌ Erro ao buscar dados de hoje.")
+    sheets = get_sheets_client()
+    data, gym_day, (day, _) = await run_sheets(sheets.get_today_state_and_row)
+    message = format_today_progress(data, gym_day, date.fromisoformat(day))
+    await update.message.reply_text(message)
 
 
+@require_auth
 async def week_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /week command - show weekly summary."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
-    try:
-        sheets = get_sheets_client()
-        week_data = sheets.get_week_data()
-        gym_day = sheets.get_gym_day_choice()
-        message = format_week_summary(week_data, gym_day)
-        await update.message.reply_text(message)
-    except Exception as e:
-        logger.error(f"Error in week_command: {e}")
-        await update.message.reply_text("❌ Erro ao buscar dados semanais.")
+    sheets = get_sheets_client()
+    # Independent reads, so they run on two Sheets workers at once
+    week_data, gym_day = await asyncio.gather(
+        run_sheets(sheets.get_week_data),
+        run_sheets(sheets.get_gym_day_choice),
+    )
+    message = format_week_summary(week_data, gym_day)
+    await update.message.reply_text(message)
 
 
+@require_auth
 async def water_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /water command - show water tracker with buttons."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
-    try:
-        sheets = get_sheets_client()
-        water_data = sheets.get_water_status()
-        message = format_water_status(water_data)
-        keyboard = build_water_keyboard(water_data)
-        await update.message.reply_text(message, reply_markup=keyboard)
-    except Exception as e:
-        logger.error(f"Error in water_command: {e}")
-        await update.message.reply_text("❌ Erro ao buscar status da água.")
+    sheets = get_sheets_client()
+    water_data = await run_sheets(sheets.get_water_status)
+    message = format_water_status(water_data)
+    keyboard = build_water_keyboard(water_data)
+    await update.message.reply_text(message, reply_markup=keyboard)
 
 
+@require_auth
 async def meal_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /meal <description> command - log a meal."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
     if not context.args:
         await update.message.reply_text("Uso: /meal <descrição>\nExemplo: /meal ovos mexidos + torrada")
         return
@@ -156,29 +384,19 @@ async def meal_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     description = " ".join(context.args)
     meal_type = get_meal_type_by_time()
 
-    try:
-        sheets = get_sheets_client()
-        sheets.log_meal(meal_type, description, is_cheat=False)
+    sheets = get_sheets_client()
 
-        # Also mark the meal action as done
-        action_map = {"B": "breakfast", "L": "lunch", "S": "snack", "D": "dinner"}
-        action = action_map.get(meal_type)
-        if action:
-            sheets.update_action(action, 1)
+    # Log the meal and mark the meal action as done in one write
+    action = MEAL_TYPE_ACTIONS.get(meal_type)
+    await run_sheets(sheets.log_meal_and_mark, meal_type, description, action)
 
-        message = format_meal_logged(meal_type, description, is_cheat=False)
-        await update.message.reply_text(message)
-    except Exception as e:
-        logger.error(f"Error in meal_command: {e}")
-        await update.message.reply_text("❌ Erro ao registrar refeição.")
+    message = format_meal_logged(meal_type, description, is_cheat=False)
+    await update.message.reply_text(message)
 
 
+@require_auth
 async def cheat_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /cheat <description> command - log a cheat meal."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
     if not context.args:
         await update.message.reply_text("Uso: /cheat <descrição>\nExemplo: /cheat pizza e cerveja")
         return
@@ -186,243 +404,162 @@ async def cheat_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     description = " ".join(context.args)
     meal_type = get_meal_type_by_time()
 
-    try:
-        sheets = get_sheets_client()
-        sheets.log_meal(meal_type, description, is_cheat=True)
-        sheets.increment_cheat_meals()
+    sheets = get_sheets_client()
+    await run_sheets(
+        sheets.log_meal_and_mark, meal_type, description, is_cheat=True
+    )
 
-        message = format_meal_logged(meal_type, description, is_cheat=True)
-        await update.message.reply_text(message)
-    except Exception as e:
-        logger.error(f"Error in cheat_command: {e}")
-        await update.message.reply_text("❌ Erro ao registrar cheat meal.")
+    message = format_meal_logged(meal_type, description, is_cheat=True)
+    await update.message.reply_text(message)
 
 
+@require_auth
 async def gym_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /gym friday|saturday command - set gym day choice."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
-    valid_days = ("friday", "saturday", "sexta", "sabado", "sábado")
-    if not context.args or context.args[0].lower() not in valid_days:
+    day = GYM_DAY_INPUTS.get(context.args[0].casefold()) if context.args else None
+    if day is None:
         await update.message.reply_text("Uso: /gym sexta ou /gym sabado")
         return
 
-    day_input = context.args[0].lower()
-    # Normalize to English for storage
-    if day_input in ("sexta", "friday"):
-        day = "friday"
-        day_pt = "Sexta"
-    else:
-        day = "saturday"
-        day_pt = "Sábado"
+    day_pt = GYM_DAY_NAMES_PT[day]
 
-    try:
-        sheets = get_sheets_client()
-        sheets.set_gym_day_choice(day)
-        await update.message.reply_text(f"✓ Dia da academia definido para {day_pt} nesta semana!")
-    except Exception as e:
-        logger.error(f"Error in gym_command: {e}")
-        await update.message.reply_text("❌ Erro ao definir dia da academia.")
+    sheets = get_sheets_client()
+    await run_sheets(sheets.set_gym_day_choice, day)
+    await update.message.reply_text(_GYM_OK(day_pt=day_pt))
 
 
+@require_auth
 async def weight_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /weight <kg> command - log weight."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
     if not context.args:
         try:
             sheets = get_sheets_client()
-            current = sheets.get_weight()
+            current = await run_sheets(sheets.get_weight)
             if current:
-                await update.message.reply_text(f"Peso atual: {current} kg\n\nUso: /weight <kg>")
+                await update.message.reply_text(_WEIGHT_CURRENT(weight=current))
             else:
                 await update.message.reply_text("Nenhum peso registrado ainda.\n\nUso: /weight <kg>")
-        except Exception as e:
-            logger.error(f"Error getting weight: {e}")
+        except Exception:
+            logger.exception("Error getting weight")
             await update.message.reply_text("Uso: /weight <kg>")
         return
 
     try:
         weight = float(context.args[0].replace(",", "."))
-        sheets = get_sheets_client()
-        sheets.log_weight(weight)
-        await update.message.reply_text(f"✓ Peso registrado: {weight} kg")
     except ValueError:
         await update.message.reply_text("Por favor, insira um número válido.\nExemplo: /weight 75.5")
-    except Exception as e:
-        logger.error(f"Error in weight_command: {e}")
-        await update.message.reply_text("❌ Erro ao registrar peso.")
+        return
+
+    sheets = get_sheets_client()
+    await run_sheets(sheets.log_weight, weight)
+    await update.message.reply_text(_WEIGHT_OK(weight=weight))
 
 
+@require_auth
 async def undo_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /undo <action> command - undo last action."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
     if not context.args:
-        await update.message.reply_text(
-            f"Uso: /undo <ação>\nAções disponíveis: {get_actions_display()}"
-        )
+        await update.message.reply_text(UNDO_USAGE)
         return
 
     action_input = context.args[0].lower()
     action = normalize_action(action_input)
 
-    if action not in ACTION_NAMES_PT:
-        await update.message.reply_text(
-            f"❌ Ação desconhecida: {action_input}\nAções disponíveis: {get_actions_display()}"
-        )
+    if action not in VALID_ACTIONS:
+        await update.message.reply_text(_UNKNOWN_ACTION(action=action_input))
         return
 
-    try:
-        sheets = get_sheets_client()
-        sheets.update_action(action, 0)
-        action_pt = ACTION_NAMES_PT.get(action, action)
-        await update.message.reply_text(f"✓ Desfeito: {action_pt}")
-    except ValueError as e:
-        await update.message.reply_text(f"❌ Ação desconhecida: {action_input}")
-    except Exception as e:
-        logger.error(f"Error in undo_command: {e}")
-        await update.message.reply_text("❌ Erro ao desfazer ação.")
+    sheets = get_sheets_client()
+    today_row = await run_sheets(sheets.get_today_row)
+    queue_action_write(sheets, today_row, action, 0)
+    action_pt = ACTION_NAMES_PT[action]
+    await update.message.reply_text(_UNDONE(action=action_pt))
 
 
-async def done_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle /done <action> command - manually log an action."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
+async def _apply_action_and_format(sheets: SheetsClient, action: str) -> str:
+    """Mark an action as done for today and build the reply for it.
 
-    if not context.args:
-        await update.message.reply_text(
-            f"Uso: /done <ação>\nAções disponíveis: {get_actions_display()}"
-        )
-        return
+    Today's state comes from a single batched read (or the cache); the
+    write is queued and reflected in the cache right away.
 
-    action_input = context.args[0].lower()
-    action = normalize_action(action_input)
+    Args:
+        sheets: Shared sheets client
+        action: Validated internal action name
 
-    if action not in ACTION_NAMES_PT:
-        await update.message.reply_text(
-            f"❌ Ação desconhecida: {action_input}\nAções disponíveis: {get_actions_display()}"
-        )
-        return
+    Returns:
+        Confirmation with any milestone reached, or a note that the action
+        was already done.
+    """
+    data, gym_day, today_row = await run_sheets(sheets.get_today_state_and_row)
+    if data.get(action):
+        return _ALREADY_DONE(action=ACTION_NAMES_PT[action])
 
-    try:
-        sheets = get_sheets_client()
+    queue_action_write(sheets, today_row, action, 1)
+    data[action] = 1
 
-        # Check if already done
-        current_value = sheets.get_action_value(action)
-        if current_value:
-            action_pt = ACTION_NAMES_PT.get(action, action)
-            await update.message.reply_text(f"✓ {action_pt} já registrado hoje!")
-            return
+    # Calculate points from the updated data, for the day the row belongs to
+    day_of_week = date.fromisoformat(today_row[0]).weekday()
 
-        # Update action
-        sheets.update_action(action, 1)
+    total = daily_grand_total(data)
+    max_total = day_max_total(day_of_week, gym_day)
 
-        # Get updated data and calculate points
-        data = sheets.get_today_data()
-        gym_day = sheets.get_gym_day_choice()
+    # Get points for this action
+    action_points = _POINTS[action]
 
-        tz = pytz.timezone(config.TIMEZONE)
-        day_of_week = datetime.now(tz).weekday()
+    # Format confirmation
+    confirmation = format_action_confirmation(
+        action,
+        action_points,
+        total,
+        max_total
+    )
 
-        points = calculate_daily_points(data)
-        max_pts = get_max_points_for_day(day_of_week, gym_day)
+    # Check for milestones (integer comparisons, no percentages needed)
+    milestone_msg = ""
+    if max_total > 0:
+        if total >= max_total:
+            milestone_msg = "\n\n" + _MILESTONE_PERFECT
+        elif 2 * total >= max_total > 2 * (total - action_points):
+            milestone_msg = "\n\n" + _MILESTONE_HALFWAY
 
-        # Get points for this action
-        action_points = config.POINTS.get(action, 1)
+    if action == "water_3":
+        milestone_msg += "\n" + _MILESTONE_WATER
 
-        # Format confirmation
-        confirmation = format_action_confirmation(
-            action,
-            action_points,
-            points["grand_total"],
-            max_pts["total"]
-        )
+    return confirmation + milestone_msg
 
-        # Check for milestones
-        milestone_msg = ""
-        percentage = points["grand_total"] / max_pts["total"] * 100 if max_pts["total"] > 0 else 0
 
-        if percentage >= 100:
-            milestone_msg = "\n\n" + format_milestone_message("perfect_day")
-        elif percentage >= 50 and (points["grand_total"] - action_points) / max_pts["total"] * 100 < 50:
-            milestone_msg = "\n\n" + format_milestone_message("halfway")
+@require_auth
+async def done_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle /done <action> command - manually log an action."""
+    if not context.args:
+        await update.message.reply_text(DONE_USAGE)
+        return
 
-        if action == "water_3":
-            milestone_msg += "\n" + format_milestone_message("water_hard_mode")
+    action_input = context.args[0].lower()
+    action = normalize_action(action_input)
 
-        await update.message.reply_text(confirmation + milestone_msg)
+    if action not in VALID_ACTIONS:
+        await update.message.reply_text(_UNKNOWN_ACTION(action=action_input))
+        return
 
-    except Exception as e:
-        logger.error(f"Error in done_command: {e}")
-        await update.message.reply_text("❌ Erro ao registrar ação.")
+    sheets = get_sheets_client()
+    await update.message.reply_text(await _apply_action_and_format(sheets, action))
 
 
+@require_auth
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /help command - show all available commands."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
-    help_text = """📋 *Comandos Disponíveis*
-
-*Progresso:*
-/hoje - Ver progresso de hoje
-/semana - Ver resumo da semana
-
-*Registrar ações:*
-/feito <ação> - Registrar uma ação manualmente
-/desfazer <ação> - Desfazer uma ação
-
-*Ações disponíveis:*
-acordar, cardio, cafe, almoco, lanche, jantar,
-agua1, agua2, agua3, copo, quarto, dormir, pilates, academia
-
-*Refeições:*
-/refeicao <descrição> - Registrar refeição
-/besteira <descrição> - Registrar cheat meal
-
-*Água e Peso:*
-/agua - Ver status da água com botões
-/peso <kg> - Registrar peso (ou ver atual)
-
-*Academia:*
-/academia sexta - Definir academia para sexta
-/academia sabado - Definir academia para sábado
-
-*Administração:*
-/add_semana <data> [dia] - Adicionar semana
-/add_mes <data> - Adicionar mês
-/setup_sheets - Configurar planilhas
-
-*Exemplos:*
-• /feito academia
-• /feito cardio
-• /desfazer cafe
-• /refeicao ovos mexidos
-• /peso 75.5
-"""
-    await update.message.reply_text(help_text, parse_mode="Markdown")
+    await update.message.reply_text(_HELP_TEXT, parse_mode="Markdown")
 
 
+@require_auth
 async def setup_sheets_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /setup_sheets command - initialize Weekly_Summary, Monthly_Summary, and Dashboard."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
     await update.message.reply_text("Configurando planilhas de análise...")
 
     try:
         sheets = get_sheets_client()
-        results = sheets.setup_all_analysis_sheets()
+        results = await run_sheets(sheets.setup_all_analysis_sheets)
 
         # Format results
         status_lines = []
@@ -435,16 +572,13 @@ async def setup_sheets_command(update: Update, context: ContextTypes.DEFAULT_TYP
         message += "\n\nNota: Certifique-se de que essas abas já existem na planilha."
         await update.message.reply_text(message)
     except Exception as e:
-        logger.error(f"Error in setup_sheets_command: {e}")
+        logger.exception("Error in setup_sheets_command")
         await update.message.reply_text(f"❌ Erro ao configurar planilhas: {e}")
 
 
+@require_auth
 async def add_week_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /add_week <start_date> [gym_day] - add a new week to Weekly_Summary."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
     if not context.args:
         await update.message.reply_text(
             "Uso: /add_week <data_início> [dia_academia]\n"
@@ -457,19 +591,16 @@ async def add_week_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
     try:
         sheets = get_sheets_client()
-        sheets.add_weekly_summary_row(start_date, gym_choice)
-        await update.message.reply_text(f"✓ Semana adicionada iniciando em {start_date}")
+        await run_sheets(sheets.add_weekly_summary_row, start_date, gym_choice)
+        await update.message.reply_text(_WEEK_ADDED(start_date=start_date))
     except Exception as e:
-        logger.error(f"Error in add_week_command: {e}")
+        logger.exception("Error in add_week_command")
         await update.message.reply_text(f"❌ Erro ao adicionar semana: {e}")
 
 
+@require_auth
 async def add_month_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /add_month <start_date> - add a new month to Monthly_Summary."""
-    if not is_authorized(update.effective_user.id):
-        await unauthorized_response(update)
-        return
-
     if not context.args:
         await update.message.reply_text(
             "Uso: /add_month <data_início>\n"
@@ -481,126 +612,136 @@ async def add_month_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     try:
         sheets = get_sheets_client()
-        sheets.add_monthly_summary_row(start_date)
-        await update.message.reply_text(f"✓ Mês adicionado iniciando em {start_date}")
+        await run_sheets(sheets.add_monthly_summary_row, start_date)
+        await update.message.reply_text(_MONTH_ADDED(start_date=start_date))
     except Exception as e:
-        logger.error(f"Error in add_month_command: {e}")
+        logger.exception("Error in add_month_command")
         await update.message.reply_text(f"❌ Erro ao adicionar mês: {e}")
 
 
 # Keyboard Builders
 
+# Water buttons in display order: (action, label)
+WATER_BUTTONS = (
+    ("water_1", "💧 Garrafa 1"),
+    ("water_2", "💧 Garrafa 2"),
+    ("water_3", "💧 Garrafa 3"),
+    ("water_copo", "💧 Copo de 300 ml"),
+)
 
-def build_water_keyboard(water_data: dict) -> InlineKeyboardMarkup:
-    """Build water tracking keyboard."""
-    buttons = []
+# Button label for each action reminder
+ACTION_BUTTON_LABELS = {
+    "wake_7am": "✓ Acordei",
+    "cardio": "✓ Feito",
+    "breakfast": "✓ Comi",
+    "lunch": "✓ Comi",
+    "snack": "✓ Comi",
+    "dinner": "✓ Comi",
+    "pilates": "✓ Feito",
+    "gym": "✓ Feito",
+    "bedroom": "✓ Feito",
+    "bed": "✓ Feito",
+}
 
-    if not water_data.get("water_1"):
-        buttons.append(InlineKeyboardButton("💧 Garrafa 1", callback_data="action:water_1"))
-    if not water_data.get("water_2"):
-        buttons.append(InlineKeyboardButton("💧 Garrafa 2", callback_data="action:water_2"))
-    if not water_data.get("water_3"):
-        buttons.append(InlineKeyboardButton("💧 Garrafa 3", callback_data="action:water_3"))
-    if not water_data.get("water_copo"):
-        buttons.append(InlineKeyboardButton("💧 Copo de 300 ml", callback_data="action:water_copo"))
 
-    # Arrange buttons in rows
-    keyboard = []
-    for i in range(0, len(buttons), 2):
-        keyboard.append(buttons[i:i+2])
+def _make_water_keyboard(done_mask: int) -> InlineKeyboardMarkup:
+    """Build the water keyboard for one bitmask of completed items.
 
-    return InlineKeyboardMarkup(keyboard) if keyboard else InlineKeyboardMarkup([])
+    Bit i of done_mask is set when WATER_BUTTONS[i] is done.
+    """
+    buttons = [
+        InlineKeyboardButton(label, callback_data=f"action:{action}")
+        for i, (action, label) in enumerate(WATER_BUTTONS)
+        if not done_mask >> i & 1
+    ]
 
+    # Arrange buttons in rows of two
+    return InlineKeyboardMarkup([buttons[i:i + 2] for i in range(0, len(buttons), 2)])
 
-def build_action_keyboard(action: str) -> InlineKeyboardMarkup:
-    """Build single action keyboard."""
-    button_labels = {
-        "wake_7am": "✓ Acordei",
-        "cardio": "✓ Feito",
-        "breakfast": "✓ Comi",
-        "lunch": "✓ Comi",
-        "snack": "✓ Comi",
-        "dinner": "✓ Comi",
-        "pilates": "✓ Feito",
-        "gym": "✓ Feito",
-        "bedroom": "✓ Feito",
-        "bed": "✓ Feito",
-    }
-
-    label = button_labels.get(action, "✓ Feito")
+
+def _make_action_keyboard(action: str, label: str) -> InlineKeyboardMarkup:
+    """Build a single action keyboard."""
     keyboard = [[InlineKeyboardButton(label, callback_data=f"action:{action}")]]
     return InlineKeyboardMarkup(keyboard)
 
 
-# Callback Handler
-
-
-async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle button callbacks."""
-    query = update.callback_query
-    await query.answer()
-
-    if not is_authorized(query.from_user.id):
-        await query.edit_message_text("⛔ Não autorizado.")
-        return
-
-    data = query.data
+# Keyboards are immutable, so every variant is built once at import
+_WATER_KEYBOARDS = tuple(
+    _make_water_keyboard(done_mask) for done_mask in range(1 << len(WATER_BUTTONS))
+)
+_ACTION_KEYBOARDS = {
+    action: _make_action_keyboard(action, label)
+    for action, label in ACTION_BUTTON_LABELS.items()
+}
 
-    if data.startswith("action:"):
-        action = data.split(":")[1]
-        await handle_action_callback(query, action)
 
+def _water_done_mask(water_data: dict) -> int:
+    """Pack the completed water items into a WATER_BUTTONS bitmask."""
+    return (
+        bool(water_data.get("water_1"))
+        | bool(water_data.get("water_2")) << 1
+        | bool(water_data.get("water_3")) << 2
+        | bool(water_data.get("water_copo")) << 3
+    )
 
-async def handle_action_callback(query, action: str) -> None:
-    """Handle action button callback."""
-    try:
-        sheets = get_sheets_client()
 
-        # Check if already done
-        current_value = sheets.get_action_value(action)
-        if current_value:
-            await query.edit_message_text(f"✓ {action} já registrado hoje!")
-            return
-
-        # Update action
-        sheets.update_action(action, 1)
+def build_water_keyboard(water_data: dict) -> InlineKeyboardMarkup:
+    """Build water tracking keyboard."""
+    return _WATER_KEYBOARDS[_water_done_mask(water_data)]
 
-        # Get updated data and calculate points
-        data = sheets.get_today_data()
-        gym_day = sheets.get_gym_day_choice()
 
-        tz = pytz.timezone(config.TIMEZONE)
-        day_of_week = datetime.now(tz).weekday()
+def build_action_keyboard(action: str) -> InlineKeyboardMarkup:
+    """Build single action keyboard."""
+    keyboard = _ACTION_KEYBOARDS.get(action)
+    if keyboard is None:
+        keyboard = _make_action_keyboard(action, "✓ Feito")
+    return keyboard
 
-        points = calculate_daily_points(data)
-        max_pts = get_max_points_for_day(day_of_week, gym_day)
 
-        # Get points for this action
-        action_points = config.POINTS.get(action, 1)
+# Callback Handler
 
-        # Format confirmation
-        confirmation = format_action_confirmation(
-            action,
-            action_points,
-            points["grand_total"],
-            max_pts["total"]
-        )
 
-        # Check for milestones
-        milestone_msg = ""
-        percentage = points["grand_total"] / max_pts["total"] * 100 if max_pts["total"] > 0 else 0
+@require_auth
+async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle button callbacks."""
+    query = update.callback_query
+    # Answer the callback while the Sheets work runs instead of before it
+    ack = asyncio.create_task(query.answer())
 
-        if percentage >= 100:
-            milestone_msg = "\n\n" + format_milestone_message("perfect_day")
-        elif percentage >= 50 and (points["grand_total"] - action_points) / max_pts["total"] * 100 < 50:
-            milestone_msg = "\n\n" + format_milestone_message("halfway")
+    try:
+        prefix, _, payload = query.data.partition(":")
+        handler = CALLBACK_HANDLERS.get(prefix)
+        if handler:
+            await handler(query, payload, context)
+    finally:
+        try:
+            await ack
+        except TelegramError:
+            # A late or failed answer only leaves the button spinner up; it
+            # must not turn the reply into an error or hide the real one
+            logger.warning("Could not answer callback query", exc_info=True)
+
+
+# Each press replies through its own Telegram connection while the write
+# is queued, so bursts rely on the pool size set in main.py
+# (config.TELEGRAM_POOL_SIZE).
+async def handle_action_callback(
+    query, action: str, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Handle action button callback.
+
+    The confirmation is computed from the cached state and sent right away;
+    the sheet write goes through the batched write queue.
+    """
+    if action not in _POINTS:
+        await query.edit_message_text(_UNKNOWN_ACTION_REPLY(action=action))
+        return
 
-        if action == "water_3":
-            milestone_msg += "\n" + format_milestone_message("water_hard_mode")
+    sheets = get_sheets_client()
+    await query.edit_message_text(await _apply_action_and_format(sheets, action))
 
-        # Update message
-        await query.edit_message_text(confirmation + milestone_msg)
 
-    except Exception as e:
-        logger.error(f"Error in handle_action_callback: {e}")
-        await query.edit_message_text("❌ Erro ao atualizar ação.")
+# Callback data prefix -> handler, e.g. "action:cardio" -> handle_action_callback
+CALLBACK_HANDLERS = {
+    "action": handle_action_callback,
+}
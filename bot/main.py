@@ -2,14 +2,20 @@
 
 import logging
 import sys
+from telegram import Update
 from telegram.ext import (
     Application,
     CommandHandler,
     CallbackQueryHandler,
+    TypeHandler,
 )
 
 import config
 from bot.handlers import (
+    auth_gate,
+    error_handler,
+    start_write_flusher,
+    stop_write_flusher,
     start_command,
     today_command,
     week_command,
@@ -36,6 +42,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# (command aliases, handler) for every command the bot answers
+COMMANDS = (
+    (("start", "iniciar"), start_command),
+    (("today", "hoje"), today_command),
+    (("week", "semana"), week_command),
+    (("water", "agua"), water_command),
+    (("meal", "refeicao"), meal_command),
+    (("cheat", "besteira"), cheat_command),
+    (("gym", "academia"), gym_command),
+    (("weight", "peso"), weight_command),
+    (("undo", "desfazer"), undo_command),
+    (("done", "feito"), done_command),
+    (("help", "ajuda"), help_command),
+    (("setup_sheets",), setup_sheets_command),
+    (("add_week", "add_semana"), add_week_command),
+    (("add_month", "add_mes"), add_month_command),
+)
+
+
 def validate_config() -> bool:
     """Validate required configuration."""
     errors = []
@@ -75,59 +100,44 @@ def main() -> None:
     application = (
         Application.builder()
         .token(config.TELEGRAM_BOT_TOKEN)
+        .concurrent_updates(config.CONCURRENT_UPDATES)
+        .connection_pool_size(config.TELEGRAM_POOL_SIZE)
+        .pool_timeout(config.TELEGRAM_POOL_TIMEOUT)
+        .post_init(start_write_flusher)
+        .post_stop(stop_write_flusher)
         .build()
     )
 
-    # Register command handlers (English + Portuguese aliases)
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("iniciar", start_command))
-
-    application.add_handler(CommandHandler("today", today_command))
-    application.add_handler(CommandHandler("hoje", today_command))
-
-    application.add_handler(CommandHandler("week", week_command))
-    application.add_handler(CommandHandler("semana", week_command))
-
-    application.add_handler(CommandHandler("water", water_command))
-    application.add_handler(CommandHandler("agua", water_command))
-
-    application.add_handler(CommandHandler("meal", meal_command))
-    application.add_handler(CommandHandler("refeicao", meal_command))
-
-    application.add_handler(CommandHandler("cheat", cheat_command))
-    application.add_handler(CommandHandler("besteira", cheat_command))
+    # Drop updates from unauthorized users before any other handler runs.
+    # This one must stay blocking so ApplicationHandlerStop takes effect.
+    application.add_handler(TypeHandler(Update, auth_gate), group=-1)
 
-    application.add_handler(CommandHandler("gym", gym_command))
-    application.add_handler(CommandHandler("academia", gym_command))
-
-    application.add_handler(CommandHandler("weight", weight_command))
-    application.add_handler(CommandHandler("peso", weight_command))
-
-    application.add_handler(CommandHandler("undo", undo_command))
-    application.add_handler(CommandHandler("desfazer", undo_command))
-
-    application.add_handler(CommandHandler("done", done_command))
-    application.add_handler(CommandHandler("feito", done_command))
-
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("ajuda", help_command))
-
-    application.add_handler(CommandHandler("setup_sheets", setup_sheets_command))
-    application.add_handler(CommandHandler("add_week", add_week_command))
-    application.add_handler(CommandHandler("add_semana", add_week_command))
-    application.add_handler(CommandHandler("add_month", add_month_command))
-    application.add_handler(CommandHandler("add_mes", add_month_command))
+    # Register command handlers (English + Portuguese aliases).
+    # block=False lets a slow Sheets call run as its own task instead of
+    # holding up the next update.
+    for aliases, callback in COMMANDS:
+        application.add_handler(CommandHandler(aliases, callback, block=False))
 
     # Register callback handler for buttons
-    application.add_handler(CallbackQueryHandler(button_callback))
+    application.add_handler(CallbackQueryHandler(button_callback, block=False))
+
+    # Log and report errors that handlers let propagate
+    application.add_error_handler(error_handler)
 
     # Set up scheduler
     setup_scheduler(application)
 
     logger.info("Bot configured successfully. Starting polling...")
 
-    # Start the bot
-    application.run_polling(drop_pending_updates=True)
+    # Start the bot. Long polling lets Telegram hold each getUpdates request
+    # open until an update arrives, and only the update types we handle are
+    # delivered. CommandHandler also answers edited commands, so those are
+    # requested too.
+    application.run_polling(
+        drop_pending_updates=True,
+        timeout=config.POLLING_TIMEOUT,
+        allowed_updates=[Update.MESSAGE, Update.EDITED_MESSAGE, Update.CALLBACK_QUERY],
+    )
 
 
 if __name__ == "__main__":
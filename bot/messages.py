@@ -1,125 +1,128 @@
 """Message templates and builders for the health bot."""
 
-from datetime import datetime
+import functools
+from datetime import date, datetime
 from typing import Optional
-import pytz
+from zoneinfo import ZoneInfo
 
 import config
 from bot.points import (
-    calculate_daily_points,
-    get_category_breakdown,
-    get_max_points_for_day,
+    daily_grand_total,
+    compute_day,
+    is_exercise_day,
     get_progress_status,
-    calculate_week_max_points,
+    WEEK_MAX_POINTS,
 )
 
+_TZ = ZoneInfo(config.TIMEZONE)
 
-def format_checkmark(done: bool) -> str:
-    """Format a checkmark based on completion status."""
-    return "✓" if done else "○"
 
+# Rule drawn under message titles
+_HDR = "━━━━━━━━━━━━━━━━━"
 
-def format_water_status(water_data: dict) -> str:
-    """Format water tracking status."""
-    w1 = water_data.get("water_1", 0)
-    w2 = water_data.get("water_2", 0)
-    w3 = water_data.get("water_3", 0)
-    wc = water_data.get("water_copo", 0)
-    total_pts = w1 + w2 * 2 + w3 * 3 + wc
-
-    lines = [
-        "💧 Hidratação",
-        "━━━━━━━━━━━━━━━━━",
-        f"[{format_checkmark(w1)}] Garrafa 1 (+1 pt)",
-        f"[{format_checkmark(w2)}] Garrafa 2 (+2 pts)",
-        f"[{format_checkmark(w3)}] Garrafa 3 (+3 pts) ⏰ antes das 20h",
-        f"[{format_checkmark(wc)}] Copo de 300 ml (+1 pt)",
-        "",
-        f"Progresso: {total_pts}/7 pts",
-    ]
+# Checkmark indexed by completion status (0 = pending, 1 = done)
+_CHECK = ("○", "✓")
 
-    return "\n".join(lines)
 
+def format_water_status(water_data: dict) -> str:
+    """Format water tracking status."""
+    get = water_data.get
+    w1, w2, w3, wc = get("water_1", 0), get("water_2", 0), get("water_3", 0), get("water_copo", 0)
+
+    return (
+        "💧 Hidratação\n"
+        f"{_HDR}\n"
+        f"[{_CHECK[1 if w1 else 0]}] Garrafa 1 (+1 pt)\n"
+        f"[{_CHECK[1 if w2 else 0]}] Garrafa 2 (+2 pts)\n"
+        f"[{_CHECK[1 if w3 else 0]}] Garrafa 3 (+3 pts) ⏰ antes das 20h\n"
+        f"[{_CHECK[1 if wc else 0]}] Copo de 300 ml (+1 pt)\n"
+        "\n"
+        f"Progresso: {w1 + w2 * 2 + w3 * 3 + wc}/7 pts"
+    )
+
+
+def format_daily_summary(
+    data: dict, gym_day_choice: Optional[str] = None, today: Optional[date] = None
+) -> str:
+    """Format end-of-day summary.
 
-def format_daily_summary(data: dict, gym_day_choice: Optional[str] = None) -> str:
-    """Format end-of-day summary."""
-    tz = pytz.timezone(config.TIMEZONE)
-    today = datetime.now(tz)
+    Pass today as the date data belongs to; defaults to the current date.
+    """
+    today = today or datetime.now(_TZ)
     date_str = today.strftime("%d/%m")
     day_of_week = today.weekday()
 
-    categories = get_category_breakdown(data, day_of_week)
-    points = calculate_daily_points(data)
-    max_pts = get_max_points_for_day(day_of_week, gym_day_choice)
+    day = compute_day(data, day_of_week, gym_day_choice)
+    categories = day.categories
+    daily_total = day.grand_total
+    max_pts = day.max_points
     is_weekend = day_of_week >= 5
 
     # Build sleep line
-    sleep = categories["sleep"]
-    sleep_parts = []
-    if not is_weekend:
-        sleep_parts.append(format_checkmark(sleep["items"].get("wake_7am", 0)))
-    sleep_parts.append(format_checkmark(sleep["items"]["bedroom"]))
-    sleep_parts.append(format_checkmark(sleep["items"]["bed"]))
-    sleep_checks = "".join(sleep_parts)
+    sleep_items = (
+        (categories.bedroom, categories.bed)
+        if is_weekend
+        else (categories.wake_7am, categories.bedroom, categories.bed)
+    )
+    sleep_checks = "".join(_CHECK[1 if v else 0] for v in sleep_items)
 
     # Build nutrition line
-    nutrition = categories["nutrition"]
-    nutrition_checks = "".join([
-        format_checkmark(nutrition["items"]["breakfast"]),
-        format_checkmark(nutrition["items"]["lunch"]),
-        format_checkmark(nutrition["items"]["snack"]),
-        format_checkmark(nutrition["items"]["dinner"]),
-    ])
+    nutrition_checks = "".join(
+        _CHECK[1 if v else 0]
+        for v in (categories.breakfast, categories.lunch, categories.snack, categories.dinner)
+    )
 
     # Build hydration line
-    hydration = categories["hydration"]
-    hydration_checks = "".join([
-        format_checkmark(hydration["items"]["water_1"]),
-        format_checkmark(hydration["items"]["water_2"]),
-        format_checkmark(hydration["items"]["water_3"]),
-        format_checkmark(hydration["items"]["water_copo"]),
-    ])
+    hydration_checks = "".join(
+        _CHECK[1 if v else 0]
+        for v in (categories.water_1, categories.water_2, categories.water_3, categories.water_copo)
+    )
 
     # Build cardio line
-    cardio = categories["cardio"]
-    cardio_check = format_checkmark(cardio["items"]["cardio"])
+    cardio_check = _CHECK[1 if categories.cardio else 0]
 
     # Build exercise line
-    exercise = categories["exercise"]
     exercise_str = ""
-    if exercise["items"]["pilates"]:
+    if categories.pilates:
         exercise_str = "🧘 Pilates"
-    elif exercise["items"]["gym"]:
+    elif categories.gym:
         exercise_str = "🏋️ Academia"
     else:
         exercise_str = "—"
 
     # Calculate totals
-    daily_total = points["grand_total"]
     max_total = max_pts["total"]
 
     # Perfect day check
     is_perfect = daily_total >= max_total
     status_emoji = "⭐ PERFEITO!" if is_perfect else ""
 
-    lines = [
-        f"📊 Resumo do Dia - {date_str}",
-        "",
-        f"Sono:       {sleep_checks} ({sleep['current']}/{sleep['max']})",
-        f"Nutrição:   {nutrition_checks} ({nutrition['current']}/{nutrition['max']})",
-        f"Hidratação: {hydration_checks} ({hydration['current']}/{hydration['max']})",
-    ]
-
-    if not is_weekend:
-        lines.append(f"Cardio:     {cardio_check} ({cardio['current']}/{cardio['max']})")
-
-    lines.extend([
-        f"Exercício:  {exercise_str} ({exercise['current']}/{max_pts['exercise']})",
-        "",
-        f"Total: {daily_total}/{max_total} pts {status_emoji}",
-    ])
-
-    return "\n".join(lines)
+    cardio_line = (
+        ""
+        if is_weekend
+        else f"Cardio:     {cardio_check} ({categories.cardio_current}/{categories.cardio_max})\n"
+    )
+
+    return (
+        f"📊 Resumo do Dia - {date_str}\n"
+        "\n"
+        f"Sono:       {sleep_checks} ({categories.sleep_current}/{categories.sleep_max})\n"
+        f"Nutrição:   {nutrition_checks} ({categories.nutrition_current}/{categories.nutrition_max})\n"
+        f"Hidratação: {hydration_checks} ({categories.hydration_current}/{categories.hydration_max})\n"
+        f"{cardio_line}"
+        f"Exercício:  {exercise_str} ({categories.exercise_current}/{max_pts['exercise']})\n"
+        "\n"
+        f"Total: {daily_total}/{max_total} pts {status_emoji}"
+    )
+
+
+# Progress status -> Portuguese label
+_STATUS_PT = {
+    "Perfect": "Perfeito",
+    "Successful": "Sucesso",
+    "Needs Improvement": "Precisa Melhorar",
+    "Danger": "Perigo",
+}
 
 
 def format_week_summary(week_data: list[dict], gym_day_choice: Optional[str] = None) -> str:
@@ -127,69 +130,97 @@ def format_week_summary(week_data: list[dict], gym_day_choice: Optional[str] = N
     if not week_data:
         return "📊 Sem dados para essa semana ainda."
 
-    tz = pytz.timezone(config.TIMEZONE)
-    today = datetime.now(tz)
-
     total_points = 0
     total_cheat = 0
     days_logged = len(week_data)
 
     for day_data in week_data:
-        points = calculate_daily_points(day_data)
-        total_points += points["grand_total"]
+        total_points += daily_grand_total(day_data)
         total_cheat += day_data.get("cheat_meals", 0)
 
-    max_weekly = calculate_week_max_points(gym_day_choice)
+    max_weekly = WEEK_MAX_POINTS
     cheat_penalty = total_cheat * 3
     final_score = max(0, total_points - cheat_penalty)
     percentage = (final_score / max_weekly) * 100 if max_weekly > 0 else 0
-    status = get_progress_status(percentage)
+    status_pt = _STATUS_PT[get_progress_status(percentage)]
 
-    # Translate status
-    status_pt = {
-        "Perfect": "Perfeito",
-        "Successful": "Sucesso",
-        "Needs Improvement": "Precisa Melhorar",
-        "Danger": "Perigo",
-    }.get(status, status)
+    return (
+        "📊 Resumo Semanal\n"
+        f"{_HDR}\n"
+        f"Dias registrados: {days_logged}/7\n"
+        f"Pontos brutos: {total_points}\n"
+        f"Cheat meals: {total_cheat} (-{cheat_penalty} pts)\n"
+        f"Pontuação final: {final_score}/{max_weekly}\n"
+        f"Progresso: {percentage:.1f}%\n"
+        f"Status: {status_pt}"
+    )
 
-    lines = [
-        f"📊 Resumo Semanal",
-        f"━━━━━━━━━━━━━━━━━",
-        f"Dias registrados: {days_logged}/7",
-        f"Pontos brutos: {total_points}",
-        f"Cheat meals: {total_cheat} (-{cheat_penalty} pts)",
-        f"Pontuação final: {final_score}/{max_weekly}",
-        f"Progresso: {percentage:.1f}%",
-        f"Status: {status_pt}",
-    ]
 
-    return "\n".join(lines)
+# Portuguese day names, Monday first
+_DAYS_PT = ("Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo")
 
 
 def _get_day_name_pt(day_of_week: int) -> str:
     """Get Portuguese day name."""
-    days = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
-    return days[day_of_week]
+    return _DAYS_PT[day_of_week]
+
 
+def _progress_actions(day_of_week: int, gym_day_choice: Optional[str]) -> tuple:
+    """List the (action, display name) pairs tracked on a day, in display order."""
+    actions = []
+    if day_of_week < 5:
+        actions.append(("wake_7am", "Acordar às 7h"))
+        actions.append(("cardio", "Cardio"))
+    actions.extend([
+        ("breakfast", "Café da manhã"),
+        ("lunch", "Almoço"),
+        ("snack", "Lanche"),
+        ("dinner", "Jantar"),
+        ("water_1", "Água #1"),
+        ("water_2", "Água #2"),
+        ("water_3", "Água #3"),
+        ("water_copo", "Copo de 300 ml"),
+        ("bedroom", "Quarto às 22h"),
+        ("bed", "Cama às 22:30"),
+    ])
 
-def format_today_progress(data: dict, gym_day_choice: Optional[str] = None) -> str:
-    """Format today's progress overview."""
-    tz = pytz.timezone(config.TIMEZONE)
-    today = datetime.now(tz)
+    # Add exercise based on day
+    if is_exercise_day(day_of_week, "pilates"):
+        actions.append(("pilates", "Pilates"))
+    if is_exercise_day(day_of_week, "gym", gym_day_choice):
+        actions.append(("gym", "Academia"))
+
+    return tuple(actions)
+
+
+# Actions listed by /today for every (day, gym choice) combination
+_PROGRESS_ACTIONS = {
+    (day, choice): _progress_actions(day, choice)
+    for day in range(7)
+    for choice in (None, "friday", "saturday")
+}
+
+
+def format_today_progress(
+    data: dict, gym_day_choice: Optional[str] = None, today: Optional[date] = None
+) -> str:
+    """Format today's progress overview.
+
+    Pass today as the date data belongs to; defaults to the current date.
+    """
+    today = today or datetime.now(_TZ)
     day_of_week = today.weekday()
     day_name = _get_day_name_pt(day_of_week)
 
-    points = calculate_daily_points(data)
-    max_pts = get_max_points_for_day(day_of_week, gym_day_choice)
-
-    current = points["grand_total"]
-    maximum = max_pts["total"]
+    day = compute_day(data, day_of_week, gym_day_choice)
+    values = day.values
+    current = day.grand_total
+    maximum = day.max_points["total"]
     percentage = (current / maximum) * 100 if maximum > 0 else 0
 
     lines = [
         f"📈 Progresso de Hoje ({day_name})",
-        f"━━━━━━━━━━━━━━━━━",
+        _HDR,
         "",
     ]
 
@@ -197,37 +228,12 @@ def format_today_progress(data: dict, gym_day_choice: Optional[str] = None) -> s
     completed = []
     pending = []
 
-    is_weekend = day_of_week >= 5
-
-    actions = []
-    if not is_weekend:
-        actions.append(("wake_7am", "Acordar às 7h", data.get("wake_7am", 0)))
-        actions.append(("cardio", "Cardio", data.get("cardio", 0)))
-    actions.extend([
-        ("breakfast", "Café da manhã", data.get("breakfast", 0)),
-        ("lunch", "Almoço", data.get("lunch", 0)),
-        ("snack", "Lanche", data.get("snack", 0)),
-        ("dinner", "Jantar", data.get("dinner", 0)),
-        ("water_1", "Água #1", data.get("water_1", 0)),
-        ("water_2", "Água #2", data.get("water_2", 0)),
-        ("water_3", "Água #3", data.get("water_3", 0)),
-        ("water_copo", "Copo de 300 ml", data.get("water_copo", 0)),
-        ("bedroom", "Quarto às 22h", data.get("bedroom", 0)),
-        ("bed", "Cama às 22:30", data.get("bed", 0)),
-    ])
+    actions = _PROGRESS_ACTIONS.get((day_of_week, gym_day_choice))
+    if actions is None:
+        actions = _PROGRESS_ACTIONS[(day_of_week, None)]
 
-    # Add exercise based on day
-    if day_of_week in config.PILATES_DAYS:
-        actions.append(("pilates", "Pilates", data.get("pilates", 0)))
-    if day_of_week in config.GYM_DAYS_FIXED:
-        actions.append(("gym", "Academia", data.get("gym", 0)))
-    elif gym_day_choice == "friday" and day_of_week == 4:
-        actions.append(("gym", "Academia", data.get("gym", 0)))
-    elif gym_day_choice == "saturday" and day_of_week == 5:
-        actions.append(("gym", "Academia", data.get("gym", 0)))
-
-    for _, name, done in actions:
-        if done:
+    for key, name in actions:
+        if values[key]:
             completed.append(f"✓ {name}")
         else:
             pending.append(f"○ {name}")
@@ -247,6 +253,26 @@ def format_today_progress(data: dict, gym_day_choice: Optional[str] = None) -> s
     return "\n".join(lines)
 
 
+# Action -> display name used in confirmations
+_ACTION_NAMES = {
+    "wake_7am": "Acordar cedo",
+    "cardio": "Cardio",
+    "breakfast": "Café da manhã",
+    "lunch": "Almoço",
+    "snack": "Lanche",
+    "dinner": "Jantar",
+    "water_1": "Água #1",
+    "water_2": "Água #2",
+    "water_3": "Água #3 (modo difícil!)",
+    "water_copo": "Copo de 300 ml",
+    "bedroom": "Hora do quarto",
+    "bed": "Hora de dormir",
+    "pilates": "Pilates",
+    "gym": "Academia",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def format_action_confirmation(
     action: str,
     points_earned: int,
@@ -254,66 +280,62 @@ def format_action_confirmation(
     max_total: int,
 ) -> str:
     """Format confirmation message after action completion."""
-    action_names = {
-        "wake_7am": "Acordar cedo",
-        "cardio": "Cardio",
-        "breakfast": "Café da manhã",
-        "lunch": "Almoço",
-        "snack": "Lanche",
-        "dinner": "Jantar",
-        "water_1": "Água #1",
-        "water_2": "Água #2",
-        "water_3": "Água #3 (modo difícil!)",
-        "water_copo": "Copo de 300 ml",
-        "bedroom": "Hora do quarto",
-        "bed": "Hora de dormir",
-        "pilates": "Pilates",
-        "gym": "Academia",
-    }
-
-    name = action_names.get(action, action)
+    name = _ACTION_NAMES.get(action, action)
     return f"✓ {name} feito! +{points_earned} pt{'s' if points_earned > 1 else ''} ({current_total}/{max_total} hoje)"
 
 
+def format_write_failed(actions: list[str], day: date) -> str:
+    """Format the warning sent when queued actions could not be saved."""
+    names = ", ".join(_ACTION_NAMES.get(action, action) for action in actions)
+    return (
+        f"⚠️ Não consegui salvar na planilha ({day.strftime('%d/%m')}): {names}\n"
+        "Registre de novo com /feito."
+    )
+
+
+# Milestone key -> celebration message
+_MILESTONE_MSGS = {
+    "halfway": "Metade do caminho! 💪",
+    "perfect_day": "DIA PERFEITO! 🎉 Pontuação máxima!",
+    "water_hard_mode": "Modo difícil completo! 💧🔥 +3 pts",
+    "gym_streak": "Consistência na academia! 🏋️",
+}
+
+
 def format_milestone_message(milestone: str) -> str:
     """Format milestone celebration message."""
-    messages = {
-        "halfway": "Metade do caminho! 💪",
-        "perfect_day": "DIA PERFEITO! 🎉 Pontuação máxima!",
-        "water_hard_mode": "Modo difícil completo! 💧🔥 +3 pts",
-        "gym_streak": "Consistência na academia! 🏋️",
-    }
-    return messages.get(milestone, "")
+    return _MILESTONE_MSGS.get(milestone, "")
+
+
+# Reminder type -> reminder message
+_REMINDERS = {
+    "wake": "⏰ Bom dia! Hora de levantar!",
+    "cardio": "🏃 Hora do cardio! Bora se mexer!",
+    "cardio_weekend": "🏃 Cardio de fim de semana! Comece o dia ativo!",
+    "breakfast": "🍳 Hora do café da manhã! Alimente-se bem!",
+    "lunch": "🍽️ Hora do almoço! Faça uma pausa e coma bem.",
+    "snack": "🍎 Hora do lanche! Mantenha a energia.",
+    "dinner": "🍲 Hora do jantar! Hora da refeição noturna.",
+    "pilates": "🧘 Hora do pilates! Alongar e fortalecer.",
+    "gym": "🏋️ Hora da academia! Bora treinar!",
+    "hydration": "💧 Check de hidratação! Como está a água?",
+    "water_warning": "⚠️ Lembrete de água! Não esqueça de se hidratar!",
+    "chores": "🏠 Lembrete de tarefas! Organize antes de dormir.",
+    "bedroom": "🌙 Hora do quarto! Comece a relaxar.",
+    "bed": "😴 Hora de dormir! Descanse bem.",
+}
 
 
 def format_reminder(reminder_type: str, is_weekend: bool = False) -> str:
     """Format a reminder message."""
-    reminders = {
-        "wake": "⏰ Bom dia! Hora de levantar!",
-        "cardio": "🏃 Hora do cardio! Bora se mexer!",
-        "cardio_weekend": "🏃 Cardio de fim de semana! Comece o dia ativo!",
-        "breakfast": "🍳 Hora do café da manhã! Alimente-se bem!",
-        "lunch": "🍽️ Hora do almoço! Faça uma pausa e coma bem.",
-        "snack": "🍎 Hora do lanche! Mantenha a energia.",
-        "dinner": "🍲 Hora do jantar! Hora da refeição noturna.",
-        "pilates": "🧘 Hora do pilates! Alongar e fortalecer.",
-        "gym": "🏋️ Hora da academia! Bora treinar!",
-        "hydration": "💧 Check de hidratação! Como está a água?",
-        "water_warning": "⚠️ Lembrete de água! Não esqueça de se hidratar!",
-        "chores": "🏠 Lembrete de tarefas! Organize antes de dormir.",
-        "bedroom": "🌙 Hora do quarto! Comece a relaxar.",
-        "bed": "😴 Hora de dormir! Descanse bem.",
-    }
-
     if reminder_type == "cardio" and is_weekend:
         reminder_type = "cardio_weekend"
 
-    return reminders.get(reminder_type, f"Lembrete: {reminder_type}")
+    return _REMINDERS.get(reminder_type, f"Lembrete: {reminder_type}")
 
 
-def format_welcome_message() -> str:
-    """Format welcome message for new users."""
-    return """
+# Shown by /start
+_WELCOME = """
 👋 Bem-vindo ao Health Tracker Bot!
 
 Vou te ajudar a acompanhar seus hábitos diários e ganhar pontos por:
@@ -353,10 +375,18 @@ Vamos ficar saudáveis! 💪
 """.strip()
 
 
+def format_welcome_message() -> str:
+    """Format welcome message for new users."""
+    return _WELCOME
+
+
+# Meal type code -> display name
+_MEAL_TYPE_NAMES = {"B": "Café da manhã", "L": "Almoço", "S": "Lanche", "D": "Jantar"}
+
+
 def format_meal_logged(meal_type: str, description: str, is_cheat: bool) -> str:
     """Format meal logged confirmation."""
-    type_names = {"B": "Café da manhã", "L": "Almoço", "S": "Lanche", "D": "Jantar"}
-    name = type_names.get(meal_type, "Refeição")
+    name = _MEAL_TYPE_NAMES.get(meal_type, "Refeição")
 
     if is_cheat:
         return f"🍔 Cheat {name.lower()} registrado: {description}\n⚠️ -3 pts de penalidade no fim da semana"
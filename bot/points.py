@@ -1,61 +1,53 @@
 """Point calculation logic for health tracking."""
 
+import functools
 from datetime import datetime
-from typing import Optional
-import pytz
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+from zoneinfo import ZoneInfo
 
 import config
 
+_TZ = ZoneInfo(config.TIMEZONE)
 
-def calculate_daily_points(data: dict) -> dict:
-    """Calculate points breakdown for a day.
+# Gym days for each gym day choice (Tuesday, Thursday + Friday or Saturday)
+_GYM_DAYS = {
+    None: frozenset(config.GYM_DAYS_FIXED),
+    "friday": frozenset(config.GYM_DAYS_FIXED) | {4},
+    "saturday": frozenset(config.GYM_DAYS_FIXED) | {5},
+}
+_PILATES_DAYS = frozenset(config.PILATES_DAYS)
 
-    Args:
-        data: Dictionary with action values
+# Fixed: 75 weekday + 26 weekend + 2 pilates + 3 gym, whatever the gym day
+WEEK_MAX_POINTS = 106
 
-    Returns:
-        Dictionary with point breakdown
-    """
-    points = {
-        "wake_7am": data.get("wake_7am", 0) * config.POINTS["wake_7am"],
-        "cardio": data.get("cardio", 0) * config.POINTS["cardio"],
-        "breakfast": data.get("breakfast", 0) * config.POINTS["breakfast"],
-        "lunch": data.get("lunch", 0) * config.POINTS["lunch"],
-        "snack": data.get("snack", 0) * config.POINTS["snack"],
-        "dinner": data.get("dinner", 0) * config.POINTS["dinner"],
-        "water_1": data.get("water_1", 0) * config.POINTS["water_1"],
-        "water_2": data.get("water_2", 0) * config.POINTS["water_2"],
-        "water_3": data.get("water_3", 0) * config.POINTS["water_3"],
-        "water_copo": data.get("water_copo", 0) * config.POINTS["water_copo"],
-        "bedroom": data.get("bedroom", 0) * config.POINTS["bedroom"],
-        "bed": data.get("bed", 0) * config.POINTS["bed"],
-        "pilates": data.get("pilates", 0) * config.POINTS["pilates"],
-        "gym": data.get("gym", 0) * config.POINTS["gym"],
-    }
 
-    points["daily_total"] = (
-        points["wake_7am"]
-        + points["cardio"]
-        + points["breakfast"]
-        + points["lunch"]
-        + points["snack"]
-        + points["dinner"]
-        + points["water_1"]
-        + points["water_2"]
-        + points["water_3"]
-        + points["water_copo"]
-        + points["bedroom"]
-        + points["bed"]
+# (action, points) pairs counted in the daily and exercise totals
+_DAILY_ITEMS = tuple(
+    (action, config.POINTS[action])
+    for action in (
+        "wake_7am", "cardio", "breakfast", "lunch", "snack", "dinner",
+        "water_1", "water_2", "water_3", "water_copo", "bedroom", "bed",
     )
+)
+_EXERCISE_ITEMS = tuple((action, config.POINTS[action]) for action in ("pilates", "gym"))
+_ALL_ITEMS = _DAILY_ITEMS + _EXERCISE_ITEMS
 
-    points["exercise_total"] = points["pilates"] + points["gym"]
-    points["grand_total"] = points["daily_total"] + points["exercise_total"]
 
-    return points
+def daily_grand_total(data: dict) -> int:
+    """Calculate a day's grand total (daily plus exercise points).
 
+    Args:
+        data: Dictionary with action values
 
-def get_max_points_for_day(day_of_week: int, gym_day_choice: Optional[str] = None) -> dict:
-    """Get maximum possible points for a specific day.
+    Returns:
+        Total points for the day
+    """
+    return sum(data.get(action, 0) * weight for action, weight in _ALL_ITEMS)
+
+
+def _compute_max_points(day_of_week: int, gym_day_choice: Optional[str]) -> dict:
+    """Compute maximum possible points for a specific day.
 
     Args:
         day_of_week: 0=Monday, 6=Sunday
@@ -73,42 +65,61 @@ def get_max_points_for_day(day_of_week: int, gym_day_choice: Optional[str] = Non
     }
 
     # Pilates days (Monday, Wednesday)
-    if day_of_week in config.PILATES_DAYS:
+    if day_of_week in _PILATES_DAYS:
         max_pts["exercise"] = 1
         max_pts["total"] += 1
 
     # Gym days (Tuesday, Thursday + Friday or Saturday)
-    gym_days = list(config.GYM_DAYS_FIXED)
-    if gym_day_choice == "friday":
-        gym_days.append(4)
-    elif gym_day_choice == "saturday":
-        gym_days.append(5)
-
-    if day_of_week in gym_days:
+    if day_of_week in _GYM_DAYS.get(gym_day_choice, _GYM_DAYS[None]):
         max_pts["exercise"] = 1
         max_pts["total"] += 1
 
     return max_pts
 
 
-def calculate_week_max_points(gym_day_choice: Optional[str] = None) -> int:
-    """Calculate maximum weekly points.
+# Every (day, gym choice) combination, computed once; results are read-only
+_MAX_POINTS_TABLE = {
+    (day, choice): MappingProxyType(_compute_max_points(day, choice))
+    for day in range(7)
+    for choice in (None, "friday", "saturday")
+}
 
-    Weekly breakdown:
-    - Weekday daily points: 15 * 5 = 75
-    - Weekend daily points: 13 * 2 = 26 (no wake/cardio)
-    - Pilates (Mon/Wed): 2
-    - Gym (Tue/Thu + 1): 3
 
-    Total: 106
+def get_max_points_for_day(day_of_week: int, gym_day_choice: Optional[str] = None) -> Mapping:
+    """Get maximum possible points for a specific day.
 
     Args:
-        gym_day_choice: 'friday' or 'saturday'
+        day_of_week: 0=Monday, 6=Sunday
+        gym_day_choice: 'friday' or 'saturday' for gym day
 
     Returns:
-        Maximum possible weekly points (106)
+        Read-only mapping with max points breakdown
     """
-    return 106  # Fixed: 75 weekday + 26 weekend + 2 pilates + 3 gym
+    max_pts = _MAX_POINTS_TABLE.get((day_of_week, gym_day_choice))
+    if max_pts is None:
+        # Any other stored choice adds no gym day, same as None
+        max_pts = _MAX_POINTS_TABLE[(day_of_week, None)]
+    return max_pts
+
+
+# Max total for every (day, gym choice), for callers that need only the int
+_MAX_TOTAL_TABLE = {key: max_pts["total"] for key, max_pts in _MAX_POINTS_TABLE.items()}
+
+
+def day_max_total(day_of_week: int, gym_day_choice: Optional[str] = None) -> int:
+    """Get the maximum total points for a specific day.
+
+    Args:
+        day_of_week: 0=Monday, 6=Sunday
+        gym_day_choice: 'friday' or 'saturday' for gym day
+
+    Returns:
+        Maximum possible total points for the day
+    """
+    max_total = _MAX_TOTAL_TABLE.get((day_of_week, gym_day_choice))
+    if max_total is None:
+        max_total = _MAX_TOTAL_TABLE[(day_of_week, None)]
+    return max_total
 
 
 def calculate_cheat_penalty(cheat_count: int) -> int:
@@ -125,6 +136,14 @@ def calculate_cheat_penalty(cheat_count: int) -> int:
     return cheat_count * 3
 
 
+# (minimum percentage, status label), highest threshold first
+STATUS_THRESHOLDS = (
+    (100, "Perfect"),
+    (85, "Successful"),
+    (70, "Needs Improvement"),
+)
+
+
 def get_progress_status(percentage: float) -> str:
     """Get status label based on percentage.
 
@@ -134,17 +153,39 @@ def get_progress_status(percentage: float) -> str:
     Returns:
         Status label
     """
-    if percentage >= 100:
-        return "Perfect"
-    elif percentage >= 85:
-        return "Successful"
-    elif percentage >= 70:
-        return "Needs Improvement"
-    else:
-        return "Danger"
-
-
-def get_category_breakdown(data: dict, day_of_week: Optional[int] = None) -> dict:
+    return next((label for minimum, label in STATUS_THRESHOLDS if percentage >= minimum), "Danger")
+
+
+class CategoryBreakdown(NamedTuple):
+    """Per-category scores for a day, with the item values behind them."""
+
+    sleep_current: int
+    sleep_max: int
+    wake_7am: int
+    bedroom: int
+    bed: int
+    nutrition_current: int
+    nutrition_max: int
+    breakfast: int
+    lunch: int
+    snack: int
+    dinner: int
+    hydration_current: int
+    hydration_max: int
+    water_1: int
+    water_2: int
+    water_3: int
+    water_copo: int
+    cardio_current: int
+    cardio_max: int
+    cardio: int
+    exercise_current: int
+    exercise_max: int
+    pilates: int
+    gym: int
+
+
+def get_category_breakdown(data: dict, day_of_week: Optional[int] = None) -> CategoryBreakdown:
     """Get breakdown by category.
 
     Categories:
@@ -154,77 +195,111 @@ def get_category_breakdown(data: dict, day_of_week: Optional[int] = None) -> dic
     - Cardio: cardio (1 pt weekday, 0 pts weekend)
     - Exercise: pilates, gym (1 pt max per day)
 
+    Wake-up and cardio are not tracked on weekends, so they read as 0 there.
+
     Args:
         data: Daily data dictionary
         day_of_week: 0=Monday, 6=Sunday (used for weekend adjustments)
 
     Returns:
-        Dictionary with category scores
+        CategoryBreakdown with category scores
     """
     is_weekend = day_of_week is not None and day_of_week >= 5
 
-    sleep_current = data.get("bedroom", 0) + data.get("bed", 0)
-    sleep_items = {
-        "bedroom": data.get("bedroom", 0),
-        "bed": data.get("bed", 0),
-    }
-    sleep_max = 2
-
-    if not is_weekend:
-        sleep_current += data.get("wake_7am", 0)
-        sleep_items["wake_7am"] = data.get("wake_7am", 0)
-        sleep_max = 3
-
-    return {
-        "sleep": {
-            "current": sleep_current,
-            "max": sleep_max,
-            "items": sleep_items,
-        },
-        "nutrition": {
-            "current": (
-                data.get("breakfast", 0)
-                + data.get("lunch", 0)
-                + data.get("snack", 0)
-                + data.get("dinner", 0)
-            ),
-            "max": 4,
-            "items": {
-                "breakfast": data.get("breakfast", 0),
-                "lunch": data.get("lunch", 0),
-                "snack": data.get("snack", 0),
-                "dinner": data.get("dinner", 0),
-            },
-        },
-        "hydration": {
-            "current": (
-                data.get("water_1", 0)
-                + data.get("water_2", 0) * 2
-                + data.get("water_3", 0) * 3
-                + data.get("water_copo", 0)
-            ),
-            "max": 7,
-            "items": {
-                "water_1": data.get("water_1", 0),
-                "water_2": data.get("water_2", 0),
-                "water_3": data.get("water_3", 0),
-                "water_copo": data.get("water_copo", 0),
-            },
-        },
-        "cardio": {
-            "current": 0 if is_weekend else data.get("cardio", 0),
-            "max": 0 if is_weekend else 1,
-            "items": {"cardio": 0 if is_weekend else data.get("cardio", 0)},
-        },
-        "exercise": {
-            "current": data.get("pilates", 0) + data.get("gym", 0),
-            "max": 1,  # Per day
-            "items": {
-                "pilates": data.get("pilates", 0),
-                "gym": data.get("gym", 0),
-            },
-        },
-    }
+    get = data.get
+    wake_7am = 0 if is_weekend else get("wake_7am", 0)
+    bedroom = get("bedroom", 0)
+    bed = get("bed", 0)
+    breakfast = get("breakfast", 0)
+    lunch = get("lunch", 0)
+    snack = get("snack", 0)
+    dinner = get("dinner", 0)
+    water_1 = get("water_1", 0)
+    water_2 = get("water_2", 0)
+    water_3 = get("water_3", 0)
+    water_copo = get("water_copo", 0)
+    cardio = 0 if is_weekend else get("cardio", 0)
+    pilates = get("pilates", 0)
+    gym = get("gym", 0)
+
+    return CategoryBreakdown(
+        sleep_current=wake_7am + bedroom + bed,
+        sleep_max=2 if is_weekend else 3,
+        wake_7am=wake_7am,
+        bedroom=bedroom,
+        bed=bed,
+        nutrition_current=breakfast + lunch + snack + dinner,
+        nutrition_max=4,
+        breakfast=breakfast,
+        lunch=lunch,
+        snack=snack,
+        dinner=dinner,
+        hydration_current=water_1 + water_2 * 2 + water_3 * 3 + water_copo,
+        hydration_max=7,
+        water_1=water_1,
+        water_2=water_2,
+        water_3=water_3,
+        water_copo=water_copo,
+        cardio_current=cardio,
+        cardio_max=0 if is_weekend else 1,
+        cardio=cardio,
+        exercise_current=pilates + gym,
+        exercise_max=1,  # Per day
+        pilates=pilates,
+        gym=gym,
+    )
+
+
+class DayResult(NamedTuple):
+    """Everything the day formatters need, computed in one pass."""
+
+    values: Mapping
+    categories: CategoryBreakdown
+    daily_total: int
+    exercise_total: int
+    grand_total: int
+    max_points: Mapping
+
+
+def compute_day(
+    data: dict, day_of_week: int, gym_day_choice: Optional[str] = None
+) -> DayResult:
+    """Compute points, category breakdown, and max points for a day.
+
+    Each tracked action is read from data once; totals and categories are
+    both derived from those values. Results are memoized on those values,
+    so formatting the same day twice computes it only once.
+
+    Args:
+        data: Daily data dictionary
+        day_of_week: 0=Monday, 6=Sunday
+        gym_day_choice: 'friday' or 'saturday' for gym day
+
+    Returns:
+        DayResult with the action values, categories, and totals
+    """
+    key = tuple(data.get(action, 0) for action in config.POINTS)
+    return _compute_day_cached(key, day_of_week, gym_day_choice)
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_day_cached(
+    key: tuple, day_of_week: int, gym_day_choice: Optional[str]
+) -> DayResult:
+    """Compute a DayResult from the action values in config.POINTS order."""
+    # Read-only, since the same result is shared by every caller
+    values = MappingProxyType(dict(zip(config.POINTS, key)))
+    daily_total = sum(values[action] * weight for action, weight in _DAILY_ITEMS)
+    exercise_total = sum(values[action] * weight for action, weight in _EXERCISE_ITEMS)
+
+    return DayResult(
+        values=values,
+        categories=get_category_breakdown(values, day_of_week),
+        daily_total=daily_total,
+        exercise_total=exercise_total,
+        grand_total=daily_total + exercise_total,
+        max_points=get_max_points_for_day(day_of_week, gym_day_choice),
+    )
 
 
 def is_exercise_day(day_of_week: int, exercise_type: str, gym_day_choice: Optional[str] = None) -> bool:
@@ -239,19 +314,27 @@ def is_exercise_day(day_of_week: int, exercise_type: str, gym_day_choice: Option
         True if exercise is scheduled for this day
     """
     if exercise_type == "pilates":
-        return day_of_week in config.PILATES_DAYS
+        return day_of_week in _PILATES_DAYS
 
     if exercise_type == "gym":
-        gym_days = list(config.GYM_DAYS_FIXED)
-        if gym_day_choice == "friday":
-            gym_days.append(4)
-        elif gym_day_choice == "saturday":
-            gym_days.append(5)
-        return day_of_week in gym_days
+        return day_of_week in _GYM_DAYS.get(gym_day_choice, _GYM_DAYS[None])
 
     return False
 
 
+def _build_hour_to_meal() -> tuple[str, ...]:
+    """Map every hour of the day to its meal type from config.MEAL_WINDOWS."""
+    hour_to_meal = ["D"] * 24  # Hours outside every window default to dinner
+    for meal_type, (start, end) in config.MEAL_WINDOWS.items():
+        for hour in range(start, end):
+            hour_to_meal[hour] = meal_type
+    return tuple(hour_to_meal)
+
+
+# Meal type for each hour (0-23)
+_HOUR_TO_MEAL = _build_hour_to_meal()
+
+
 def get_meal_type_by_time(hour: Optional[int] = None) -> str:
     """Determine meal type based on current time.
 
@@ -262,11 +345,5 @@ def get_meal_type_by_time(hour: Optional[int] = None) -> str:
         Meal type: B, L, S, or D
     """
     if hour is None:
-        tz = pytz.timezone(config.TIMEZONE)
-        hour = datetime.now(tz).hour
-
-    for meal_type, (start, end) in config.MEAL_WINDOWS.items():
-        if start <= hour < end:
-            return meal_type
-
-    return "D"  # Default to dinner
+        hour = datetime.now(_TZ).hour
+    return _HOUR_TO_MEAL[hour]
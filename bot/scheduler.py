@@ -1,13 +1,18 @@
 """Scheduler setup and scheduled jobs for the health bot."""
 
+import functools
 import logging
-from datetime import datetime, time, tzinfo
+from datetime import date, datetime, time, tzinfo
+from zoneinfo import ZoneInfo
 from telegram.ext import Application
-import pytz
 
 import config
-from bot.sheets import SheetsClient
-from bot.handlers import build_action_keyboard, build_water_keyboard
+from bot.handlers import (
+    build_action_keyboard,
+    build_water_keyboard,
+    get_sheets_client,
+    run_sheets,
+)
 from bot.messages import (
     format_reminder,
     format_water_status,
@@ -17,10 +22,15 @@ from bot.points import is_exercise_day
 
 logger = logging.getLogger(__name__)
 
+_TZ = ZoneInfo(config.TIMEZONE)
+
+# Every scheduled message goes to the single configured user
+_CHAT_ID = config.TELEGRAM_USER_ID
+
 
-def get_sheets_client() -> SheetsClient:
-    """Get or create sheets client."""
-    return SheetsClient()
+def _weekday_now() -> int:
+    """Get today's weekday (0=Monday, 6=Sunday) in the configured timezone."""
+    return datetime.now(_TZ).weekday()
 
 
 def parse_time(time_str: str, tz: tzinfo) -> time:
@@ -29,11 +39,16 @@ def parse_time(time_str: str, tz: tzinfo) -> time:
     return time(hour=hour, minute=minute, tzinfo=tz)
 
 
+# config.SCHEDULE parsed once at import: key -> timezone-aware time
+_TIMES = {key: parse_time(value, _TZ) for key, value in config.SCHEDULE.items()}
+
+
 async def send_reminder(
     context,
     reminder_type: str,
     action: str = None,
     include_keyboard: bool = True,
+    is_weekend: bool = False,
 ) -> None:
     """Send a reminder message.
 
@@ -42,278 +57,245 @@ async def send_reminder(
         reminder_type: Type of reminder
         action: Action for the keyboard button (optional)
         include_keyboard: Whether to include action button
+        is_weekend: Whether today is Saturday or Sunday (only changes the
+            cardio text)
     """
-    try:
-        tz = pytz.timezone(config.TIMEZONE)
-        is_weekend = datetime.now(tz).weekday() >= 5
-
-        message = format_reminder(reminder_type, is_weekend)
-
-        if include_keyboard and action:
-            keyboard = build_action_keyboard(action)
-            await context.bot.send_message(
-                chat_id=config.TELEGRAM_USER_ID,
-                text=message,
-                reply_markup=keyboard,
-            )
-        else:
-            await context.bot.send_message(
-                chat_id=config.TELEGRAM_USER_ID,
-                text=message,
-            )
-    except Exception as e:
-        logger.error(f"Error sending reminder {reminder_type}: {e}")
+    await context.bot.send_message(
+        chat_id=_CHAT_ID,
+        text=format_reminder(reminder_type, is_weekend),
+        reply_markup=build_action_keyboard(action) if include_keyboard and action else None,
+    )
 
 
 async def send_water_tracker(context) -> None:
     """Send water tracking message with buttons."""
-    try:
-        sheets = get_sheets_client()
-        water_data = sheets.get_water_status()
-        message = format_water_status(water_data)
-        keyboard = build_water_keyboard(water_data)
-
-        await context.bot.send_message(
-            chat_id=config.TELEGRAM_USER_ID,
-            text=message,
-            reply_markup=keyboard,
-        )
-    except Exception as e:
-        logger.error(f"Error sending water tracker: {e}")
+    sheets = get_sheets_client()
+    water_data = await run_sheets(sheets.get_water_status)
+    message = format_water_status(water_data)
+    keyboard = build_water_keyboard(water_data)
+
+    await context.bot.send_message(
+        chat_id=_CHAT_ID,
+        text=message,
+        reply_markup=keyboard,
+    )
 
 
-async def send_water_warning(context) -> None:
-    """Send water warning if behind target."""
-    try:
-        sheets = get_sheets_client()
-        water_data = sheets.get_water_status()
+def _water_all_done(water_data: dict) -> bool:
+    """Check whether every water item is done."""
+    return bool(
+        water_data.get("water_1") and water_data.get("water_2")
+        and water_data.get("water_3") and water_data.get("water_copo")
+    )
 
-        # Check if all water items are done
-        if (water_data.get("water_1") and water_data.get("water_2")
-                and water_data.get("water_3") and water_data.get("water_copo")):
-            return  # All done, no warning needed
 
-        message = "⚠️ Water reminder! Don't forget to hydrate!\n\n"
-        message += format_water_status(water_data)
-        keyboard = build_water_keyboard(water_data)
+async def send_daily_summary(context) -> None:
+    """Send end-of-day summary."""
+    sheets = get_sheets_client()
+    data, gym_day, (day, _) = await run_sheets(sheets.get_today_state_and_row)
+    message = format_daily_summary(data, gym_day, date.fromisoformat(day))
 
-        await context.bot.send_message(
-            chat_id=config.TELEGRAM_USER_ID,
-            text=message,
-            reply_markup=keyboard,
-        )
-    except Exception as e:
-        logger.error(f"Error sending water warning: {e}")
+    await context.bot.send_message(
+        chat_id=_CHAT_ID,
+        text=message,
+    )
 
 
-async def send_daily_summary(context) -> None:
-    """Send end-of-day summary."""
-    try:
-        sheets = get_sheets_client()
-        data = sheets.get_today_data()
-        gym_day = sheets.get_gym_day_choice()
-        message = format_daily_summary(data, gym_day)
+def _safe_job(func):
+    """Log and swallow errors raised by a scheduled job.
 
-        await context.bot.send_message(
-            chat_id=config.TELEGRAM_USER_ID,
-            text=message,
-        )
-    except Exception as e:
-        logger.error(f"Error sending daily summary: {e}")
+    A failed job must not stop the jobs after it in the same time slot.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(context) -> None:
+        try:
+            await func(context)
+        except Exception:
+            logger.exception("Scheduled job %s failed", func.__name__)
+
+    return wrapper
 
 
 # Job callbacks for each scheduled reminder
 
 
+@_safe_job
 async def wake_reminder_job(context) -> None:
     """7am wake reminder (weekdays only)."""
-    tz = pytz.timezone(config.TIMEZONE)
-    if datetime.now(tz).weekday() < 5:  # Monday-Friday
-        await send_reminder(context, "wake", "wake_7am")
+    await send_reminder(context, "wake", "wake_7am")
 
 
+@_safe_job
 async def cardio_weekday_job(context) -> None:
     """7am cardio reminder (weekdays only)."""
-    tz = pytz.timezone(config.TIMEZONE)
-    if datetime.now(tz).weekday() < 5:  # Monday-Friday
-        await send_reminder(context, "cardio", "cardio")
+    await send_reminder(context, "cardio", "cardio")
 
 
+@_safe_job
 async def wake_reminder_weekend_job(context) -> None:
     """10am weekend wake reminder (informational, no tracking)."""
-    tz = pytz.timezone(config.TIMEZONE)
-    if datetime.now(tz).weekday() >= 5:  # Saturday-Sunday
-        await send_reminder(context, "wake")
+    await send_reminder(context, "wake", is_weekend=True)
 
 
+@_safe_job
 async def breakfast_job(context) -> None:
     """8am breakfast reminder."""
     await send_reminder(context, "breakfast", "breakfast")
 
 
+@_safe_job
 async def lunch_job(context) -> None:
     """12pm lunch reminder."""
     await send_reminder(context, "lunch", "lunch")
 
 
+@_safe_job
 async def hydration_job(context) -> None:
     """2pm hydration check."""
     await send_water_tracker(context)
 
 
+@_safe_job
 async def snack_job(context) -> None:
     """4pm snack reminder."""
     await send_reminder(context, "snack", "snack")
 
 
+# Exercise reminded for every (weekday, gym choice): 'pilates', 'gym', or None
+_EXERCISE_PLAN = {
+    (day, choice): (
+        "pilates" if is_exercise_day(day, "pilates")
+        else "gym" if is_exercise_day(day, "gym", choice)
+        else None
+    )
+    for day in range(7)
+    for choice in (None, "friday", "saturday")
+}
+
+# Weekdays whose exercise depends on the gym day choice
+_GYM_CHOICE_DAYS = frozenset(
+    day for day in range(7)
+    if len({_EXERCISE_PLAN[(day, choice)] for choice in (None, "friday", "saturday")}) > 1
+)
+
+
+@_safe_job
 async def exercise_job(context) -> None:
     """6pm exercise reminder (pilates or gym based on day)."""
-    tz = pytz.timezone(config.TIMEZONE)
-    day_of_week = datetime.now(tz).weekday()
+    day_of_week = _weekday_now()
 
-    try:
+    # Only the choosable gym days need the stored choice from Sheets
+    gym_day = None
+    if day_of_week in _GYM_CHOICE_DAYS:
         sheets = get_sheets_client()
-        gym_day = sheets.get_gym_day_choice()
+        gym_day = await run_sheets(sheets.get_gym_day_choice)
 
-        if is_exercise_day(day_of_week, "pilates"):
-            await send_reminder(context, "pilates", "pilates")
-        elif is_exercise_day(day_of_week, "gym", gym_day):
-            await send_reminder(context, "gym", "gym")
-    except Exception as e:
-        logger.error(f"Error in exercise_job: {e}")
+    exercise = _EXERCISE_PLAN.get((day_of_week, gym_day), _EXERCISE_PLAN[(day_of_week, None)])
+    if exercise:
+        await send_reminder(context, exercise, exercise)
 
 
+@_safe_job
 async def dinner_job(context) -> None:
-    """7pm dinner reminder."""
-    await send_reminder(context, "dinner", "dinner")
+    """7pm dinner reminder, followed by the water warning if behind.
 
+    The warning is its own message: pressing a button edits its message
+    and drops the keyboard, so one press must not take the other buttons.
+    """
+    await send_reminder(context, "dinner", "dinner")
 
-async def water_warning_job(context) -> None:
-    """7pm water warning (if behind)."""
-    await send_water_warning(context)
+    sheets = get_sheets_client()
+    # No Sheets read needed when the water was already seen done today
+    if sheets.water_done_today():
+        return
+    water_data = await run_sheets(sheets.get_water_status)
+    if _water_all_done(water_data):
+        return
+
+    await context.bot.send_message(
+        chat_id=_CHAT_ID,
+        text=format_reminder("water_warning") + "\n\n" + format_water_status(water_data),
+        reply_markup=build_water_keyboard(water_data),
+    )
 
 
+@_safe_job
 async def chores_job(context) -> None:
     """9:30pm chores reminder (no button)."""
     await send_reminder(context, "chores", include_keyboard=False)
 
 
+@_safe_job
 async def bedroom_job(context) -> None:
     """10pm bedroom reminder."""
     await send_reminder(context, "bedroom", "bedroom")
 
 
+@_safe_job
 async def bed_job(context) -> None:
-    """10:30pm bed reminder with daily summary."""
+    """10:30pm bed reminder."""
     await send_reminder(context, "bed", "bed")
-    await send_daily_summary(context)
 
 
-def setup_scheduler(application: Application) -> None:
-    """Set up all scheduled jobs.
-
-    Args:
-        application: Telegram bot application
-    """
-    tz = pytz.timezone(config.TIMEZONE)
-    job_queue = application.job_queue
-
-    # Parse schedule times with timezone
-    times = {k: parse_time(v, tz) for k, v in config.SCHEDULE.items()}
-
-    # Schedule all jobs
-    # Wake reminder - 7am weekdays
-    job_queue.run_daily(
-        wake_reminder_job,
-        time=times["wake_reminder"],
-        days=(0, 1, 2, 3, 4),  # Mon-Fri
-        name="wake_reminder",
-    )
-
-    # Cardio weekday - 7am weekdays
-    job_queue.run_daily(
-        cardio_weekday_job,
-        time=times["cardio_weekday"],
-        days=(0, 1, 2, 3, 4),  # Mon-Fri
-        name="cardio_weekday",
-    )
-
-    # Wake reminder weekend - 10am weekends (informational only)
-    job_queue.run_daily(
-        wake_reminder_weekend_job,
-        time=times["wake_reminder_weekend"],
-        days=(5, 6),  # Sat-Sun
-        name="wake_reminder_weekend",
-    )
-
-    # Breakfast - 8am daily
-    job_queue.run_daily(
-        breakfast_job,
-        time=times["breakfast"],
-        name="breakfast",
-    )
+@_safe_job
+async def daily_summary_job(context) -> None:
+    """10:30pm daily summary, sent after the bed reminder."""
+    await send_daily_summary(context)
 
-    # Lunch - 12pm daily
-    job_queue.run_daily(
-        lunch_job,
-        time=times["lunch"],
-        name="lunch",
-    )
 
-    # Hydration check - 2pm daily
-    job_queue.run_daily(
-        hydration_job,
-        time=times["hydration_check"],
-        name="hydration",
-    )
+# run_daily days, numbered like cron: 0=Sunday, 6=Saturday
+WEEKDAYS = (1, 2, 3, 4, 5)
+WEEKENDS = (0, 6)
+EVERY_DAY = (0, 1, 2, 3, 4, 5, 6)
+
+# Every scheduled job: (config.SCHEDULE key, callback, days it runs on)
+_JOBS = (
+    ("wake_reminder", wake_reminder_job, WEEKDAYS),
+    ("cardio_weekday", cardio_weekday_job, WEEKDAYS),
+    ("wake_reminder_weekend", wake_reminder_weekend_job, WEEKENDS),  # Informational only
+    ("breakfast", breakfast_job, EVERY_DAY),
+    ("lunch", lunch_job, EVERY_DAY),
+    ("hydration_check", hydration_job, EVERY_DAY),
+    ("snack", snack_job, EVERY_DAY),
+    ("exercise", exercise_job, EVERY_DAY),  # Pilates or gym, by day
+    ("dinner", dinner_job, EVERY_DAY),  # Then the water warning if behind
+    ("chores", chores_job, EVERY_DAY),
+    ("bedroom", bedroom_job, EVERY_DAY),
+    ("bed", bed_job, EVERY_DAY),
+    ("bed", daily_summary_job, EVERY_DAY),
+)
 
-    # Snack - 4pm daily
-    job_queue.run_daily(
-        snack_job,
-        time=times["snack"],
-        name="snack",
-    )
 
-    # Exercise - 6pm (varies by day)
-    job_queue.run_daily(
-        exercise_job,
-        time=times["exercise"],
-        name="exercise",
-    )
+async def _run_slot(context) -> None:
+    """Run every job sharing one time slot, in schedule order."""
+    for job in context.job.data:
+        await job(context)
 
-    # Dinner - 7pm daily
-    job_queue.run_daily(
-        dinner_job,
-        time=times["dinner"],
-        name="dinner",
-    )
 
-    # Water warning - 7pm daily
-    job_queue.run_daily(
-        water_warning_job,
-        time=times["water_warning"],
-        name="water_warning",
-    )
+def setup_scheduler(application: Application) -> None:
+    """Set up all scheduled jobs.
 
-    # Chores - 9:30pm daily
-    job_queue.run_daily(
-        chores_job,
-        time=times["chores"],
-        name="chores",
-    )
+    Jobs that fire at the same time on the same days share one timer.
 
-    # Bedroom - 10pm daily
-    job_queue.run_daily(
-        bedroom_job,
-        time=times["bedroom"],
-        name="bedroom",
-    )
+    Args:
+        application: Telegram bot application
+    """
+    job_queue = application.job_queue
 
-    # Bed - 10:30pm daily
-    job_queue.run_daily(
-        bed_job,
-        time=times["bed"],
-        name="bed",
-    )
+    # Group jobs by (time, days), keeping schedule order within each slot
+    slots = {}
+    for key, job, days in _JOBS:
+        slots.setdefault((_TIMES[key], days), []).append(job)
+
+    for (fire_time, days), jobs in slots.items():
+        job_queue.run_daily(
+            _run_slot,
+            time=fire_time,
+            days=days,
+            data=tuple(jobs),
+            # Callback names, since several jobs can share a SCHEDULE key
+            name="+".join(job.__name__ for job in jobs),
+        )
 
-    logger.info("Scheduler set up with all daily jobs")
+    logger.info(f"Scheduler set up with {len(slots)} daily slots for {len(_JOBS)} jobs")
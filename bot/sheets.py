@@ -1,14 +1,277 @@
 """Google Sheets API wrapper for health tracking."""
 
+import contextlib
+import re
+import threading
+import time
 from datetime import datetime, date, timedelta
-from typing import Optional
-import pytz
-
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from typing import TYPE_CHECKING, Any, Optional
+from zoneinfo import ZoneInfo
 
 import config
 
+if TYPE_CHECKING:
+    from googleapiclient.http import HttpRequest
+
+# Marker for a cache miss, since None is a valid cached value
+_MISSING = object()
+
+# Daily_Log range prefix for each column, e.g. 'cardio' -> 'Daily_Log!D';
+# append the row number to address today's cell
+_ACTION_RANGE_PREFIXES = {
+    name: f"{config.SHEET_DAILY_LOG}!{chr(ord('A') + idx)}"
+    for name, idx in config.DAILY_COLUMNS.items()
+}
+
+# (column name, index) pairs of a Daily_Log row
+_DAILY_ITEMS = tuple(config.DAILY_COLUMNS.items())
+
+# Daily_Log columns that make up the water tracker
+_WATER_ACTIONS = ("water_1", "water_2", "water_3", "water_copo")
+
+
+def _coerce_int(value: Any) -> Any:
+    """Convert a Daily_Log cell to int, keeping text (dates, names) as is.
+
+    Empty cells count as 0.
+    """
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return value if value else 0
+
+
+# Summary sheet formulas, formatted per row with r = the row number. Columns
+# B and C of the summary row hold the period's start and end dates.
+_IN_PERIOD = 'Daily_Log!A:A,">="&B{r},Daily_Log!A:A,"<="&C{r}'
+
+# Daily_Log weekday criteria (column B holds the English day name)
+_SATURDAY = 'Daily_Log!B:B,"Saturday"'
+_SUNDAY = 'Daily_Log!B:B,"Sunday"'
+_NOT_SATURDAY = 'Daily_Log!B:B,"<>Saturday"'
+_NOT_SUNDAY = 'Daily_Log!B:B,"<>Sunday"'
+
+# Dashboard period: Monday of the current week through today
+_THIS_WEEK = (
+    'Daily_Log!A:A,">="&(TODAY()-WEEKDAY(TODAY(),2)+1),Daily_Log!A:A,"<="&TODAY()'
+)
+
+
+def _sumifs(col: str, period: str = _IN_PERIOD) -> str:
+    """SUMIFS of a Daily_Log column over a period (the row's by default)."""
+    return f"SUMIFS(Daily_Log!{col}:{col},{period})"
+
+
+def _countifs(*criteria: str, period: str = _IN_PERIOD) -> str:
+    """COUNTIFS of Daily_Log rows in a period, plus extra criteria."""
+    return f"COUNTIFS({','.join((period,) + criteria)})"
+
+
+def _max_possible(period: str = _IN_PERIOD) -> str:
+    """Formula for the most points the days logged in a period could score.
+
+    Weekdays are worth 15, weekend days 13, plus one per exercise day.
+    """
+    return (
+        "="
+        + _countifs(_NOT_SATURDAY, _NOT_SUNDAY, period=period) + "*15+"
+        + _countifs(_SATURDAY, period=period) + "*13+"
+        + _countifs(_SUNDAY, period=period) + "*13+"
+        + _countifs('Daily_Log!O:O,">"&0', period=period) + "+"
+        + _countifs('Daily_Log!P:P,">"&0', period=period)
+    )
+
+
+# Weekly_Summary columns A-N; {start} and {gym} are filled per week
+_WEEKLY_ROW_TEMPLATE = (
+    "=ISOWEEKNUM(B{r})",  # A: week_num
+    "{start}",  # B: start_date
+    "=B{r}+6",  # C: end_date
+    "{gym}",  # D: gym_choice (manual)
+    # E: sleep_pts (C=wake, M=bedroom, N=bed)
+    f"={_sumifs('C')}+{_sumifs('M')}+{_sumifs('N')}",
+    # F: nutrition_pts
+    f"={_sumifs('E')}+{_sumifs('F')}+{_sumifs('G')}+{_sumifs('H')}",
+    # G: hydration_pts (I=water_1, J=water_2*2, K=water_3*3, L=water_copo)
+    f"={_sumifs('I')}+{_sumifs('J')}*2+{_sumifs('K')}*3+{_sumifs('L')}",
+    f"={_sumifs('D')}",  # H: cardio_pts
+    f"={_sumifs('O')}+{_sumifs('P')}",  # I: exercise_pts (O=pilates, P=gym)
+    "=E{r}+F{r}+G{r}+H{r}+I{r}",  # J: raw_score
+    f"={_sumifs('Q')}*3",  # K: cheat_penalty (Q=cheat_meals)
+    "=MAX(0,J{r}-K{r})",  # L: final_score
+    "=L{r}/106",  # M: percentage
+    # N: status
+    '=IF(M{r}>=1,"Perfeito",IF(M{r}>=0.85,"Sucesso",'
+    'IF(M{r}>=0.7,"Precisa Melhorar","Perigo")))',
+)
+
+# Monthly_Summary columns A-L; {start} is filled per month
+_MONTHLY_ROW_TEMPLATE = (
+    '=TEXT(B{r},"YYYY-MM")',  # A: month
+    "{start}",  # B: start_date
+    "=EOMONTH(B{r},0)",  # C: end_date
+    f"={_countifs()}",  # D: days_tracked
+    f"={_sumifs('T')}",  # E: total_pts (T=total_pts)
+    _max_possible(),  # F: max_possible
+    f"={_sumifs('Q')}",  # G: cheat_meals (Q=cheat_meals)
+    "=G{r}*3",  # H: cheat_penalty
+    "=MAX(0,E{r}-H{r})",  # I: final_score
+    "=IF(D{r}>0,I{r}/D{r},0)",  # J: avg_daily
+    # K: perfect_days (R=daily_pts: 15 on weekdays, 13 on weekends)
+    "="
+    + _countifs("Daily_Log!R:R,15") + "+"
+    + _countifs("Daily_Log!R:R,13", _SATURDAY) + "+"
+    + _countifs("Daily_Log!R:R,13", _SUNDAY),
+    # L: status
+    '=IF(J{r}>=15,"Perfeito",IF(J{r}>=12,"Excelente",'
+    'IF(J{r}>=10,"Bom",IF(J{r}>=8,"Precisa Melhorar","Perigo"))))',
+)
+
+# Dashboard cells (columns A-D); every formula is relative to TODAY()
+_DASHBOARD_ROWS = (
+    # Seção A: Semana Atual (Linhas 1-6)
+    ("SEMANA ATUAL", "", "", ""),
+    ("Semana", "=ISOWEEKNUM(TODAY())", "", ""),
+    ("Dias Registrados", f"={_countifs(period=_THIS_WEEK)}", "", ""),
+    ("Pontos", f"={_sumifs('T', _THIS_WEEK)}", "", ""),
+    ("Max Possível", _max_possible(_THIS_WEEK), "", ""),
+    ("Progresso", "=IF(B5>0,B4/B5,0)", "", ""),
+    # Linha 7: Vazia
+    ("", "", "", ""),
+    # Seção B: Hoje (Linhas 8-14)
+    ("HOJE", "", "", ""),
+    ("Data", "=TODAY()", "", ""),
+    ("Pts Diários", "=IFERROR(INDEX(Daily_Log!R:R,MATCH(TODAY(),Daily_Log!A:A,0)),0)", "", ""),
+    ("Exercício", "=IFERROR(INDEX(Daily_Log!S:S,MATCH(TODAY(),Daily_Log!A:A,0)),0)", "", ""),
+    ("Total", "=B10+B11", "", ""),
+    ("Besteiras", "=IFERROR(INDEX(Daily_Log!Q:Q,MATCH(TODAY(),Daily_Log!A:A,0)),0)", "", ""),
+    (
+        "Status",
+        '=IF(B12>=IF(WEEKDAY(TODAY(),2)>=6,13,15),"Perfeito",IF(B12>=10,"Bom","Atrasado"))',
+        "",
+        "",
+    ),
+    # Linha 15: Vazia
+    ("", "", "", ""),
+    # Seção C: Estatísticas (Linhas 16-22)
+    ("ESTATÍSTICAS", "", "", ""),
+    ("Total de Dias", "=COUNTA(Daily_Log!A:A)-1", "", ""),
+    (
+        "Dias Perfeitos",
+        "=COUNTIF(Daily_Log!R:R,15)"
+        f"+COUNTIFS(Daily_Log!R:R,13,{_SATURDAY})"
+        f"+COUNTIFS(Daily_Log!R:R,13,{_SUNDAY})",
+        "",
+        "",
+    ),
+    ("Média Pts Diários", "=IFERROR(AVERAGE(Daily_Log!T:T),0)", "", ""),
+    ("Total Besteiras", "=SUM(Daily_Log!Q:Q)", "", ""),
+    ("Melhor Semana", "=MAX(Weekly_Summary!L:L)", "", ""),
+    (
+        "Peso Atual",
+        '=IFERROR(INDEX(Config!B:B,MATCH("current_weight",Config!A:A,0)),"--")',
+        "",
+        "",
+    ),
+    # Linha 23: Vazia
+    ("", "", "", ""),
+    # Seção D: Semana por Categoria (Linhas 24-30)
+    ("SEMANA POR CATEGORIA", "", "", ""),
+    # Sono (C=acordar, M=quarto, N=cama)
+    ("Sono", "=" + "+".join(_sumifs(col, _THIS_WEEK) for col in "CMN"), "/19", ""),
+    # Nutrição
+    ("Nutrição", "=" + "+".join(_sumifs(col, _THIS_WEEK) for col in "EFGH"), "/28", ""),
+    # Hidratação (I=garrafa_1, J=garrafa_2*2, K=garrafa_3*3, L=copo_300ml)
+    (
+        "Hidratação",
+        f"={_sumifs('I', _THIS_WEEK)}+{_sumifs('J', _THIS_WEEK)}*2"
+        f"+{_sumifs('K', _THIS_WEEK)}*3+{_sumifs('L', _THIS_WEEK)}",
+        "/49",
+        "",
+    ),
+    # Cardio (somente dias úteis, max 5)
+    ("Cardio", f"={_sumifs('D', _THIS_WEEK)}", "/5", ""),
+    # Exercício (O=pilates, P=academia)
+    ("Exercício", f"={_sumifs('O', _THIS_WEEK)}+{_sumifs('P', _THIS_WEEK)}", "/5", ""),
+    # Total
+    ("TOTAL", "=SUM(B25:B29)", "/106", ""),
+)
+
+
+def _weekly_summary_row(row_num: int, start_date: str, gym_choice: str) -> list[str]:
+    """Build a Weekly_Summary row for the week starting on start_date."""
+    return [
+        cell.format(r=row_num, start=start_date, gym=gym_choice)
+        for cell in _WEEKLY_ROW_TEMPLATE
+    ]
+
+
+def _monthly_summary_row(row_num: int, start_date: str) -> list[str]:
+    """Build a Monthly_Summary row for the month starting on start_date."""
+    return [cell.format(r=row_num, start=start_date) for cell in _MONTHLY_ROW_TEMPLATE]
+
+
+# Weekly_Summary sheet written by setup: headers plus 13 weeks, Jan 6 - Mar 30, 2026
+_WEEKLY_SUMMARY_ROWS = (
+    (
+        "num_semana",
+        "data_inicio",
+        "data_fim",
+        "dia_academia",
+        "pts_sono",
+        "pts_nutricao",
+        "pts_hidratacao",
+        "pts_cardio",
+        "pts_exercicio",
+        "pontuacao_bruta",
+        "penalidade_besteira",
+        "pontuacao_final",
+        "porcentagem",
+        "status",
+    ),
+) + tuple(
+    tuple(_weekly_summary_row(row_num, start_date, ""))
+    for row_num, start_date in enumerate(
+        (
+            "2026-01-06",  # Week 1
+            "2026-01-13",  # Week 2
+            "2026-01-20",  # Week 3
+            "2026-01-27",  # Week 4
+            "2026-02-03",  # Week 5
+            "2026-02-10",  # Week 6
+            "2026-02-17",  # Week 7
+            "2026-02-24",  # Week 8
+            "2026-03-03",  # Week 9
+            "2026-03-10",  # Week 10
+            "2026-03-17",  # Week 11
+            "2026-03-24",  # Week 12
+            "2026-03-31",  # Week 13
+        ),
+        start=2,
+    )
+)
+
+# Monthly_Summary sheet written by setup: headers plus January-March 2026
+_MONTHLY_SUMMARY_ROWS = (
+    (
+        "mes",
+        "data_inicio",
+        "data_fim",
+        "dias_registrados",
+        "pts_total",
+        "max_possivel",
+        "besteiras",
+        "penalidade_besteira",
+        "pontuacao_final",
+        "media_diaria",
+        "dias_perfeitos",
+        "status",
+    ),
+) + tuple(
+    tuple(_monthly_summary_row(row_num, start_date))
+    for row_num, start_date in enumerate(("2026-01-01", "2026-02-01", "2026-03-01"), start=2)
+)
+
 
 class SheetsClient:
     """Client for interacting with Google Sheets."""
@@ -24,13 +287,61 @@ class SheetsClient:
     }
 
     def __init__(self):
+        # The Google client stack is slow to import, so it is loaded on first
+        # use instead of when the bot starts
+        from google.oauth2.service_account import Credentials
+        from googleapiclient.discovery import build
+
         self.credentials = Credentials.from_service_account_info(
             config.get_google_credentials(), scopes=self.SCOPES
         )
-        self.service = build("sheets", "v4", credentials=self.credentials)
+        self.service = build(
+            "sheets",
+            "v4",
+            credentials=self.credentials,
+            requestBuilder=self._build_request,
+            # The bundled static discovery document is used either way; this
+            # skips probing for a discovery cache before reading it
+            cache_discovery=False,
+        )
         self.sheet = self.service.spreadsheets()
         self.spreadsheet_id = config.GOOGLE_SHEETS_ID
-        self.tz = pytz.timezone(config.TIMEZONE)
+        self.tz = ZoneInfo(config.TIMEZONE)
+        # key -> (date, expires_at, value); see _cache_get/_cache_set
+        self._cache: dict[str, tuple[str, float, Any]] = {}
+        # Date on which every water item was last seen done; kept past the
+        # cache TTL since only the bot marks water during the day
+        self._water_done_day: Optional[str] = None
+        # (date, row number) of today's Daily_Log row; rows are only ever
+        # appended, so the number holds for the rest of the day
+        self._today_row: Optional[tuple[str, int]] = None
+        self._today_row_lock = threading.Lock()
+        # (date, action) -> value queued for writing but not yet written;
+        # overlaid on fresh reads so they don't undo a confirmed press
+        self._pending: dict[tuple[str, str], int] = {}
+        self._pending_lock = threading.Lock()
+        self._sheet_ids: Optional[dict[str, int]] = None
+        self._local = threading.local()
+
+    def _build_request(self, http, *args, **kwargs) -> "HttpRequest":
+        """Build an API request on this thread's authorized Http object.
+
+        Handlers call the client from worker threads and httplib2.Http is
+        not thread-safe, so each thread keeps its own connection and reuses
+        it across requests.
+        """
+        from googleapiclient.http import HttpRequest
+
+        authorized_http = getattr(self._local, "http", None)
+        if authorized_http is None:
+            import google_auth_httplib2
+            import httplib2
+
+            authorized_http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=httplib2.Http(timeout=config.SHEETS_HTTP_TIMEOUT)
+            )
+            self._local.http = authorized_http
+        return HttpRequest(authorized_http, *args, **kwargs)
 
     def _get_today_str(self) -> str:
         """Get today's date as YYYY-MM-DD string."""
@@ -40,9 +351,91 @@ class SheetsClient:
         """Get today's day name."""
         return datetime.now(self.tz).strftime("%A")
 
-    def _col_letter(self, col_index: int) -> str:
-        """Convert column index (0-based) to letter (A, B, C, ...)."""
-        return chr(ord("A") + col_index)
+    def _cache_get(self, key: str) -> Any:
+        """Get a cached value, or _MISSING if absent, expired, or from another day."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return _MISSING
+        day, expires_at, value = entry
+        if day != self._get_today_str() or time.monotonic() >= expires_at:
+            self._cache.pop(key, None)
+            return _MISSING
+        return value
+
+    def _cache_set(self, key: str, value: Any) -> None:
+        """Cache a value for today, expiring after config.SHEETS_CACHE_TTL seconds."""
+        self._cache[key] = (
+            self._get_today_str(),
+            time.monotonic() + config.SHEETS_CACHE_TTL,
+            value,
+        )
+
+    def _cache_invalidate(self, key: str) -> None:
+        """Drop a cached value."""
+        self._cache.pop(key, None)
+
+    def _remember_water(self, data: dict) -> None:
+        """Record whether today's data has every water item done."""
+        if all(data.get(action) for action in _WATER_ACTIONS):
+            self._water_done_day = self._get_today_str()
+        else:
+            self._water_done_day = None
+
+    def water_done_today(self) -> bool:
+        """Check, without reading the sheet, whether all water is known done today."""
+        return self._water_done_day == self._get_today_str()
+
+    @contextlib.contextmanager
+    def batch_writes(self):
+        """Collect the values writes made inside the block into one request.
+
+        Writes made through _write on this thread are held until the block
+        exits and then sent with a single values.batchUpdate per value input
+        option. If the block raises, the held writes are dropped. Nested
+        blocks join the outermost one.
+        """
+        if getattr(self._local, "pending_writes", None) is not None:
+            yield
+            return
+
+        self._local.pending_writes = []
+        try:
+            yield
+            pending = self._local.pending_writes
+        finally:
+            self._local.pending_writes = None
+
+        by_option: dict[str, list[dict]] = {}
+        for range_, values, value_input_option in pending:
+            by_option.setdefault(value_input_option, []).append(
+                {"range": range_, "majorDimension": "ROWS", "values": values}
+            )
+        for value_input_option, data in by_option.items():
+            self.sheet.values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={"valueInputOption": value_input_option, "data": data},
+            ).execute(num_retries=config.SHEETS_NUM_RETRIES)
+
+    def _write(self, range_: str, values: list, value_input_option: str = "RAW") -> None:
+        """Write values to a range now, or hold them inside batch_writes()."""
+        pending = getattr(self._local, "pending_writes", None)
+        if pending is not None:
+            pending.append((range_, values, value_input_option))
+            return
+
+        self.sheet.values().update(
+            spreadsheetId=self.spreadsheet_id,
+            range=range_,
+            valueInputOption=value_input_option,
+            body={"values": values},
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
+
+    def _action_range_prefix(self, action: str) -> str:
+        """Get the Daily_Log range prefix for an action, validating it."""
+        prefix = _ACTION_RANGE_PREFIXES.get(action)
+        if prefix is None:
+            raise ValueError(f"Unknown action: {action}")
+        return prefix
 
     def get_or_create_today_row(self) -> int:
         """Get today's row number, creating it if it doesn't exist.
@@ -50,13 +443,37 @@ class SheetsClient:
         Returns:
             Row number (1-indexed) for today's entry.
         """
-        today = self._get_today_str()
+        return self.get_today_row()[1]
 
+    def get_today_row(self) -> tuple[str, int]:
+        """Get today's date and row number, creating the row if it doesn't exist.
+
+        The row number is remembered for the rest of the day, so column A is
+        only scanned on the first call each day.
+
+        Returns:
+            Tuple of (today's date as YYYY-MM-DD, 1-indexed row number).
+        """
+        today = self._get_today_str()
+        cached = self._today_row
+        if cached is not None and cached[0] == today:
+            return cached
+
+        # Only one thread scans (and possibly creates) the row at a time
+        with self._today_row_lock:
+            cached = self._today_row
+            if cached is not None and cached[0] == today:
+                return cached
+            self._today_row = (today, self._find_or_create_row(today))
+            return self._today_row
+
+    def _find_or_create_row(self, today: str) -> int:
+        """Scan column A for today's row, appending a new one if missing."""
         # Get all dates from column A
         result = self.sheet.values().get(
             spreadsheetId=self.spreadsheet_id,
             range=f"{config.SHEET_DAILY_LOG}!A:A",
-        ).execute()
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
 
         values = result.get("values", [])
 
@@ -90,7 +507,7 @@ class SheetsClient:
             range=f"{config.SHEET_DAILY_LOG}!A{row_num}",
             valueInputOption="USER_ENTERED",
             body={"values": [new_row]},
-        ).execute()
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
 
         return row_num
 
@@ -104,19 +521,52 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        if action not in config.DAILY_COLUMNS:
-            raise ValueError(f"Unknown action: {action}")
-
+        prefix = self._action_range_prefix(action)
         row = self.get_or_create_today_row()
-        col_index = config.DAILY_COLUMNS[action]
-        col_letter = self._col_letter(col_index)
 
-        self.sheet.values().update(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_DAILY_LOG}!{col_letter}{row}",
-            valueInputOption="RAW",
-            body={"values": [[value]]},
-        ).execute()
+        self._write(f"{prefix}{row}", [[value]])
+        self.cache_action(action, value)
+
+        return True
+
+    def update_actions(self, day: str, row: int, updates: dict[str, int]) -> bool:
+        """Update several actions of one day's row with a single batchUpdate.
+
+        The row is passed in rather than looked up, so writes queued just
+        before midnight still land on the day they were made. If the write
+        fails, the cached copy of today's row is dropped.
+
+        Args:
+            day: Date of the row (YYYY-MM-DD)
+            row: Daily_Log row number of that day
+            updates: Mapping of action name to value
+
+        Returns:
+            True if successful.
+        """
+        data = [
+            {"range": f"{self._action_range_prefix(action)}{row}", "values": [[value]]}
+            for action, value in updates.items()
+        ]
+
+        try:
+            self.sheet.values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={"valueInputOption": "RAW", "data": data},
+            ).execute(num_retries=config.SHEETS_NUM_RETRIES)
+        except Exception:
+            with self._pending_lock:
+                self._clear_pending(day, updates)
+                # The cache already shows these values; drop it so the next
+                # read reports what the sheet really holds
+                self._cache_invalidate("today_data")
+                self._water_done_day = None
+            raise
+
+        with self._pending_lock:
+            self._clear_pending(day, updates)
+            for action, value in updates.items():
+                self.cache_action(action, value, day)
 
         return True
 
@@ -129,17 +579,19 @@ class SheetsClient:
         Returns:
             Current value (0 or 1 typically)
         """
-        if action not in config.DAILY_COLUMNS:
-            raise ValueError(f"Unknown action: {action}")
+        prefix = self._action_range_prefix(action)
+
+        cached = self._cache_get("today_data")
+        if cached is not _MISSING:
+            value = cached.get(action, 0)
+            return value if isinstance(value, int) else 0
 
         row = self.get_or_create_today_row()
-        col_index = config.DAILY_COLUMNS[action]
-        col_letter = self._col_letter(col_index)
 
         result = self.sheet.values().get(
             spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_DAILY_LOG}!{col_letter}{row}",
-        ).execute()
+            range=f"{prefix}{row}",
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
 
         values = result.get("values", [[0]])
         try:
@@ -153,54 +605,149 @@ class SheetsClient:
         Returns:
             Dictionary with all action values for today.
         """
-        row = self.get_or_create_today_row()
+        cached = self._cache_get("today_data")
+        if cached is not _MISSING:
+            return dict(cached)
+
+        today, row = self.get_today_row()
 
         result = self.sheet.values().get(
             spreadsheetId=self.spreadsheet_id,
             range=f"{config.SHEET_DAILY_LOG}!A{row}:T{row}",
-        ).execute()
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
 
         values = result.get("values", [[]])[0]
+        data = self._parse_daily_row(values)
+        self._cache_today_data(data, today)
+        return data
 
-        # Pad with zeros if needed
-        while len(values) < len(config.DAILY_COLUMNS):
-            values.append(0)
+    def _parse_daily_row(self, values: list) -> dict:
+        """Convert a raw Daily_Log row into a dictionary keyed by column name."""
+        count = len(values)
+        return {
+            name: _coerce_int(values[idx]) if idx < count else 0
+            for name, idx in _DAILY_ITEMS
+        }
 
-        data = {}
-        for name, idx in config.DAILY_COLUMNS.items():
-            try:
-                val = values[idx] if idx < len(values) else 0
-                # Try to convert to int, keep as string if fails
-                data[name] = int(val) if str(val).isdigit() else val
-            except (ValueError, TypeError):
-                data[name] = values[idx] if idx < len(values) else 0
+    def _batch_get(self, ranges: list[str]) -> list[dict]:
+        """Read several ranges in one values.batchGet request.
 
-        return data
+        Args:
+            ranges: A1 ranges to read
+
+        Returns:
+            One ValueRange dict per requested range, in order.
+        """
+        result = self.sheet.values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=ranges,
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
+        return result.get("valueRanges", [])
 
-    def increment_cheat_meals(self) -> int:
-        """Increment the cheat meals counter for today.
+    def get_today_state(self) -> tuple[dict, Optional[str]]:
+        """Get today's data and the gym day choice.
 
         Returns:
-            New cheat meal count.
+            Tuple of (today's data, gym day choice).
         """
-        current = self.get_action_value("cheat_meals")
-        new_value = current + 1
-        self.update_action("cheat_meals", new_value)
-        return new_value
+        data, gym_day, _ = self.get_today_state_and_row()
+        return data, gym_day
 
-    def log_meal(
-        self, meal_type: str, description: str, is_cheat: bool = False
-    ) -> bool:
-        """Log a meal to the Meals_Log sheet.
+    def get_today_state_and_row(self) -> tuple[dict, Optional[str], tuple[str, int]]:
+        """Get today's data, the gym day choice, and the row they came from.
 
-        Args:
-            meal_type: B, L, S, or D
-            description: Meal description
-            is_cheat: Whether this is a cheat meal
+        Served from the cache when both are fresh; otherwise today's row and
+        the Config sheet are read with a single batchGet.
 
         Returns:
-            True if successful.
+            Tuple of (today's data, gym day choice, (date, row number)).
         """
+        today_row = self.get_today_row()
+        data = self._cache_get("today_data")
+        gym_day = self._cache_get("gym_day_choice")
+        if data is not _MISSING and gym_day is not _MISSING and data.get("date") == today_row[0]:
+            return dict(data), gym_day, today_row
+
+        row = today_row[1]
+        value_ranges = self._batch_get([
+            f"{config.SHEET_DAILY_LOG}!A{row}:T{row}",
+            f"{config.SHEET_CONFIG}!A:B",
+        ])
+
+        row_values = value_ranges[0].get("values", [[]])[0] if value_ranges else []
+        data = self._parse_daily_row(row_values)
+
+        gym_day = None
+        config_rows = value_ranges[1].get("values", []) if len(value_ranges) > 1 else []
+        for config_row in config_rows:
+            if len(config_row) >= 2 and config_row[0] == "gym_day_choice":
+                gym_day = config_row[1]
+                break
+
+        self._cache_today_data(data, today_row[0])
+        self._cache_set("gym_day_choice", gym_day)
+        return data, gym_day, today_row
+
+    def queue_action(self, action: str, value: int, day: str) -> None:
+        """Record a value that will be written to day's row later.
+
+        The value goes into the cached copy of today's row now, and is laid
+        over any fresh read of that row until update_actions writes it.
+
+        Args:
+            action: Action name (e.g., 'cardio', 'water_1')
+            value: Value queued for writing
+            day: Date of the row it will be written to
+        """
+        with self._pending_lock:
+            self.cache_action(action, value, day)
+            self._pending[(day, action)] = value
+
+    def _clear_pending(self, day: str, updates: dict[str, int]) -> None:
+        """Forget queued values once written, unless re-queued with a new value.
+
+        Callers hold _pending_lock.
+        """
+        for action, value in updates.items():
+            if self._pending.get((day, action)) == value:
+                del self._pending[(day, action)]
+
+    def _cache_today_data(self, data: dict, day: str) -> None:
+        """Cache a fresh read of today's row with queued values laid over it."""
+        with self._pending_lock:
+            for (pending_day, action), value in self._pending.items():
+                if pending_day == day:
+                    data[action] = value
+            self._cache_set("today_data", dict(data))
+            self._remember_water(data)
+
+    def cache_action(self, action: str, value: int = 1, day: Optional[str] = None) -> None:
+        """Record an action value in the cached copy of today's row.
+
+        Lets a confirmation be shown before the write reaches the sheet
+        without a later read undoing it.
+
+        Args:
+            action: Action name (e.g., 'cardio', 'water_1')
+            value: Value to record (default 1)
+            day: Date the value belongs to (default today); values for an
+                earlier day leave today's cache alone
+        """
+        if action not in config.DAILY_COLUMNS:
+            raise ValueError(f"Unknown action: {action}")
+        if day is not None and day != self._get_today_str():
+            return
+
+        cached = self._cache_get("today_data")
+        if cached is not _MISSING:
+            cached[action] = value
+            if action in _WATER_ACTIONS:
+                self._remember_water(cached)
+        elif action in _WATER_ACTIONS and not value:
+            self._water_done_day = None
+
+    def _build_meal_row(self, meal_type: str, description: str, is_cheat: bool) -> list:
+        """Build a Meals_Log row for a meal logged now."""
         now = datetime.now(self.tz)
         timestamp = now.isoformat()
         date_str = now.strftime("%Y-%m-%d")
@@ -208,7 +755,7 @@ class SheetsClient:
         # Convert meal type to full Portuguese name
         meal_name = self.MEAL_TYPE_NAMES.get(meal_type, meal_type)
 
-        new_row = [
+        return [
             timestamp,
             date_str,
             meal_name,
@@ -216,13 +763,95 @@ class SheetsClient:
             "Sim" if is_cheat else "Não",
         ]
 
-        self.sheet.values().append(
+    def _get_sheet_id(self, title: str) -> int:
+        """Get the numeric sheetId for a sheet (tab) title.
+
+        The ids are fetched once and cached, since spreadsheets.batchUpdate
+        requests address sheets by id rather than by name.
+        """
+        if self._sheet_ids is None:
+            result = self.sheet.get(
+                spreadsheetId=self.spreadsheet_id,
+                fields="sheets.properties(sheetId,title)",
+            ).execute(num_retries=config.SHEETS_NUM_RETRIES)
+            self._sheet_ids = {
+                sheet["properties"]["title"]: sheet["properties"]["sheetId"]
+                for sheet in result.get("sheets", [])
+            }
+        return self._sheet_ids[title]
+
+    def log_meal_and_mark(
+        self,
+        meal_type: str,
+        description: str,
+        action: Optional[str] = None,
+        is_cheat: bool = False,
+    ) -> bool:
+        """Log a meal and update today's row in a single write.
+
+        Appends the meal to Meals_Log and, in the same
+        spreadsheets.batchUpdate, either marks the meal action as done or
+        increments today's cheat meal counter.
+
+        Args:
+            meal_type: B, L, S, or D
+            description: Meal description
+            action: Meal action to mark as done (ignored for cheat meals)
+            is_cheat: Whether this is a cheat meal
+
+        Returns:
+            True if successful.
+        """
+        new_row = self._build_meal_row(meal_type, description, is_cheat)
+        requests = [
+            {
+                "appendCells": {
+                    "sheetId": self._get_sheet_id(config.SHEET_MEALS_LOG),
+                    "rows": [
+                        {
+                            "values": [
+                                {"userEnteredValue": {"stringValue": value}}
+                                for value in new_row
+                            ]
+                        }
+                    ],
+                    "fields": "userEnteredValue",
+                }
+            }
+        ]
+
+        if is_cheat:
+            action, value = "cheat_meals", self.get_action_value("cheat_meals") + 1
+        else:
+            value = 1
+
+        if action:
+            row = self.get_or_create_today_row()
+            col_index = config.DAILY_COLUMNS[action]
+            requests.append(
+                {
+                    "updateCells": {
+                        "range": {
+                            "sheetId": self._get_sheet_id(config.SHEET_DAILY_LOG),
+                            "startRowIndex": row - 1,
+                            "endRowIndex": row,
+                            "startColumnIndex": col_index,
+                            "endColumnIndex": col_index + 1,
+                        },
+                        "rows": [{"values": [{"userEnteredValue": {"numberValue": value}}]}],
+                        "fields": "userEnteredValue",
+                    }
+                }
+            )
+
+        # Not retried, since the meal append must not run twice
+        self.sheet.batchUpdate(
             spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_MEALS_LOG}!A:E",
-            valueInputOption="RAW",
-            insertDataOption="INSERT_ROWS",
-            body={"values": [new_row]},
+            body={"requests": requests},
         ).execute()
+        if action:
+            # Keep the cached row current instead of forcing a re-read
+            self.cache_action(action, value)
 
         return True
 
@@ -246,6 +875,40 @@ class SheetsClient:
             ),
         }
 
+    def _load_config(self) -> dict[str, tuple[Optional[str], int]]:
+        """Get the Config sheet, reading it only when the cached copy is stale.
+
+        Returns:
+            {key: (value, row number)}.
+        """
+        cached = self._cache_get("config")
+        if cached is not _MISSING:
+            return cached
+
+        result = self.sheet.values().get(
+            spreadsheetId=self.spreadsheet_id,
+            range=f"{config.SHEET_CONFIG}!A:B",
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
+
+        values = result.get("values", [])
+        entries = {}
+        for i, row in enumerate(values, start=1):
+            if not row:
+                continue
+            # Reads take the first row with a value for the key; writes go to
+            # the first row holding the key at all
+            value, row_num = entries.get(row[0], (None, i))
+            if value is None and len(row) >= 2:
+                value = row[1]
+            entries[row[0]] = (value, row_num)
+
+        self._cache_set("config", entries)
+        return entries
+
+    def refresh_config(self) -> None:
+        """Drop the cached Config sheet so the next lookup reads it again."""
+        self._cache_invalidate("config")
+
     def get_config_value(self, key: str) -> Optional[str]:
         """Get a value from the Config sheet.
 
@@ -255,16 +918,8 @@ class SheetsClient:
         Returns:
             Value if found, None otherwise.
         """
-        result = self.sheet.values().get(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_CONFIG}!A:B",
-        ).execute()
-
-        values = result.get("values", [])
-        for row in values:
-            if len(row) >= 2 and row[0] == key:
-                return row[1]
-        return None
+        value, _ = self._load_config().get(key, (None, 0))
+        return value
 
     def set_config_value(self, key: str, value: str) -> bool:
         """Set a value in the Config sheet.
@@ -276,33 +931,24 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        result = self.sheet.values().get(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_CONFIG}!A:B",
-        ).execute()
-
-        values = result.get("values", [])
-
-        # Find existing key
-        for i, row in enumerate(values):
-            if row and row[0] == key:
-                self.sheet.values().update(
-                    spreadsheetId=self.spreadsheet_id,
-                    range=f"{config.SHEET_CONFIG}!B{i + 1}",
-                    valueInputOption="RAW",
-                    body={"values": [[value]]},
-                ).execute()
-                return True
-
-        # Add new key
-        self.sheet.values().append(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_CONFIG}!A:B",
-            valueInputOption="RAW",
-            insertDataOption="INSERT_ROWS",
-            body={"values": [[key, value]]},
-        ).execute()
-
+        entries = self._load_config()
+
+        if key in entries:
+            row_num = entries[key][1]
+            self._write(f"{config.SHEET_CONFIG}!B{row_num}", [[value]])
+        else:
+            # Add new key. Not retried, since the append must not run twice
+            result = self.sheet.values().append(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{config.SHEET_CONFIG}!A:B",
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": [[key, value]]},
+            ).execute()
+            updated_range = result["updates"]["updatedRange"]  # e.g. 'Config!A7:B7'
+            row_num = int(re.search(r"(\d+)$", updated_range).group(1))
+
+        self._cache_set("config", {**entries, key: (value, row_num)})
         return True
 
     def get_gym_day_choice(self) -> Optional[str]:
@@ -311,7 +957,13 @@ class SheetsClient:
         Returns:
             'friday' or 'saturday', or None if not set.
         """
-        return self.get_config_value("gym_day_choice")
+        cached = self._cache_get("gym_day_choice")
+        if cached is not _MISSING:
+            return cached
+
+        gym_day = self.get_config_value("gym_day_choice")
+        self._cache_set("gym_day_choice", gym_day)
+        return gym_day
 
     def set_gym_day_choice(self, day: str) -> bool:
         """Set the gym day choice for the current week.
@@ -324,7 +976,10 @@ class SheetsClient:
         """
         if day.lower() not in ("friday", "saturday"):
             raise ValueError("Gym day must be 'friday' or 'saturday'")
-        return self.set_config_value("gym_day_choice", day.lower())
+        self.set_config_value("gym_day_choice", day.lower())
+        # Set only after the write, so a read racing it can't cache the old day
+        self._cache_set("gym_day_choice", day.lower())
+        return True
 
     def get_week_data(self) -> list[dict]:
         """Get data for the current week (Monday to today).
@@ -336,11 +991,19 @@ class SheetsClient:
         # Find Monday of this week
         monday = now - timedelta(days=now.weekday())
 
-        # Get all data from Daily_Log
+        # Rows are appended one per day in date order, so when today's row
+        # is known this week's rows are among the weekday + 1 rows ending
+        # there; otherwise read the whole log below the header
+        range_ = f"{config.SHEET_DAILY_LOG}!A2:T"
+        today_row = self._today_row
+        if today_row is not None and today_row[0] == now.strftime("%Y-%m-%d"):
+            start_row = max(2, today_row[1] - now.weekday())
+            range_ = f"{config.SHEET_DAILY_LOG}!A{start_row}:T{today_row[1]}"
+
         result = self.sheet.values().get(
             spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_DAILY_LOG}!A:T",
-        ).execute()
+            range=range_,
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
 
         values = result.get("values", [])
         week_data = []
@@ -349,14 +1012,7 @@ class SheetsClient:
 
         for row in values:
             if row and row[0] >= monday_str:
-                data = {}
-                for name, idx in config.DAILY_COLUMNS.items():
-                    try:
-                        val = row[idx] if idx < len(row) else 0
-                        data[name] = int(val) if str(val).isdigit() else val
-                    except (ValueError, TypeError, IndexError):
-                        data[name] = 0
-                week_data.append(data)
+                week_data.append(self._parse_daily_row(row))
 
         return week_data
 
@@ -393,86 +1049,11 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        headers = [
-            "num_semana",
-            "data_inicio",
-            "data_fim",
-            "dia_academia",
-            "pts_sono",
-            "pts_nutricao",
-            "pts_hidratacao",
-            "pts_cardio",
-            "pts_exercicio",
-            "pontuacao_bruta",
-            "penalidade_besteira",
-            "pontuacao_final",
-            "porcentagem",
-            "status",
-        ]
-
-        # Generate 13 weeks: Jan 6 - Mar 30, 2026
-        weeks = [
-            ("2026-01-06", ""),  # Week 1
-            ("2026-01-13", ""),  # Week 2
-            ("2026-01-20", ""),  # Week 3
-            ("2026-01-27", ""),  # Week 4
-            ("2026-02-03", ""),  # Week 5
-            ("2026-02-10", ""),  # Week 6
-            ("2026-02-17", ""),  # Week 7
-            ("2026-02-24", ""),  # Week 8
-            ("2026-03-03", ""),  # Week 9
-            ("2026-03-10", ""),  # Week 10
-            ("2026-03-17", ""),  # Week 11
-            ("2026-03-24", ""),  # Week 12
-            ("2026-03-31", ""),  # Week 13
-        ]
-
-        all_rows = [headers]
-
-        for i, (start_date, gym_choice) in enumerate(weeks):
-            row_num = i + 2  # Row numbers start at 2
-            row_formulas = [
-                f"=ISOWEEKNUM(B{row_num})",  # A: week_num
-                start_date,  # B: start_date
-                f"=B{row_num}+6",  # C: end_date
-                gym_choice,  # D: gym_choice (manual)
-                # E: sleep_pts (C=wake, M=bedroom, N=bed)
-                f'=SUMIFS(Daily_Log!C:C,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-                f'+SUMIFS(Daily_Log!M:M,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-                f'+SUMIFS(Daily_Log!N:N,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-                # F: nutrition_pts
-                f'=SUMIFS(Daily_Log!E:E,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-                f'+SUMIFS(Daily_Log!F:F,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-                f'+SUMIFS(Daily_Log!G:G,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-                f'+SUMIFS(Daily_Log!H:H,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-                # G: hydration_pts (I=water_1, J=water_2*2, K=water_3*3, L=water_copo)
-                f'=SUMIFS(Daily_Log!I:I,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-                f'+SUMIFS(Daily_Log!J:J,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})*2'
-                f'+SUMIFS(Daily_Log!K:K,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})*3'
-                f'+SUMIFS(Daily_Log!L:L,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-                # H: cardio_pts
-                f'=SUMIFS(Daily_Log!D:D,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-                # I: exercise_pts (O=pilates, P=gym)
-                f'=SUMIFS(Daily_Log!O:O,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-                f'+SUMIFS(Daily_Log!P:P,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-                f"=E{row_num}+F{row_num}+G{row_num}+H{row_num}+I{row_num}",  # J: raw_score
-                # K: cheat_penalty (Q=cheat_meals)
-                f'=SUMIFS(Daily_Log!Q:Q,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})*3',
-                f"=MAX(0,J{row_num}-K{row_num})",  # L: final_score
-                f"=L{row_num}/106",  # M: percentage
-                # N: status
-                f'=IF(M{row_num}>=1,"Perfeito",IF(M{row_num}>=0.85,"Sucesso",'
-                f'IF(M{row_num}>=0.7,"Precisa Melhorar","Perigo")))',
-            ]
-            all_rows.append(row_formulas)
-
-        # Write all rows at once
-        self.sheet.values().update(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_WEEKLY_SUMMARY}!A1",
-            valueInputOption="USER_ENTERED",
-            body={"values": all_rows},
-        ).execute()
+        self._write(
+            f"{config.SHEET_WEEKLY_SUMMARY}!A1",
+            [list(row) for row in _WEEKLY_SUMMARY_ROWS],
+            "USER_ENTERED",
+        )
 
         return True
 
@@ -484,68 +1065,11 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        headers = [
-            "mes",
-            "data_inicio",
-            "data_fim",
-            "dias_registrados",
-            "pts_total",
-            "max_possivel",
-            "besteiras",
-            "penalidade_besteira",
-            "pontuacao_final",
-            "media_diaria",
-            "dias_perfeitos",
-            "status",
-        ]
-
-        # 3 months: January, February, March 2026
-        months = [
-            "2026-01-01",
-            "2026-02-01",
-            "2026-03-01",
-        ]
-
-        all_rows = [headers]
-
-        for i, start_date in enumerate(months):
-            row_num = i + 2  # Row numbers start at 2
-            row_formulas = [
-                f'=TEXT(B{row_num},"YYYY-MM")',  # A: month
-                start_date,  # B: start_date
-                f"=EOMONTH(B{row_num},0)",  # C: end_date
-                # D: days_tracked
-                f'=COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-                # E: total_pts (T=total_pts)
-                f'=SUMIFS(Daily_Log!T:T,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-                # F: max_possible (weekday=15, weekend=13, +exercise days)
-                f'=COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!B:B,"<>Saturday",Daily_Log!B:B,"<>Sunday")*15'
-                f'+COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!B:B,"Saturday")*13'
-                f'+COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!B:B,"Sunday")*13'
-                f'+COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!O:O,">"&0)'
-                f'+COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!P:P,">"&0)',
-                # G: cheat_meals (Q=cheat_meals)
-                f'=SUMIFS(Daily_Log!Q:Q,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-                f"=G{row_num}*3",  # H: cheat_penalty
-                f"=MAX(0,E{row_num}-H{row_num})",  # I: final_score
-                f"=IF(D{row_num}>0,I{row_num}/D{row_num},0)",  # J: avg_daily
-                # K: perfect_days (R=daily_pts: 15 on weekdays, 13 on weekends)
-                f'=COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!R:R,15)'
-                f'+COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!R:R,13,Daily_Log!B:B,"Saturday")'
-                f'+COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!R:R,13,Daily_Log!B:B,"Sunday")',
-                # L: status
-                f'=IF(J{row_num}>=15,"Perfeito",IF(J{row_num}>=12,"Excelente",'
-                f'IF(J{row_num}>=10,"Bom",IF(J{row_num}>=8,"Precisa Melhorar","Perigo"))))',
-            ]
-            all_rows.append(row_formulas)
-
-        # Write all rows at once
-        self.sheet.values().update(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_MONTHLY_SUMMARY}!A1",
-            valueInputOption="USER_ENTERED",
-            body={"values": all_rows},
-        ).execute()
+        self._write(
+            f"{config.SHEET_MONTHLY_SUMMARY}!A1",
+            [list(row) for row in _MONTHLY_SUMMARY_ROWS],
+            "USER_ENTERED",
+        )
 
         return True
 
@@ -555,176 +1079,49 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        # Week start formula helper (Monday of current week)
-        week_start = "(TODAY()-WEEKDAY(TODAY(),2)+1)"
-
-        # Build dashboard data
-        dashboard_data = [
-            # Seção A: Semana Atual (Linhas 1-6)
-            ["SEMANA ATUAL", "", "", ""],
-            ["Semana", "=ISOWEEKNUM(TODAY())", "", ""],
-            [
-                "Dias Registrados",
-                f'=COUNTIFS(Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())',
-                "",
-                "",
-            ],
-            [
-                "Pontos",
-                f'=SUMIFS(Daily_Log!T:T,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())',
-                "",
-                "",
-            ],
-            [
-                "Max Possível",
-                f'=COUNTIFS(Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY(),Daily_Log!B:B,"<>Saturday",Daily_Log!B:B,"<>Sunday")*15'
-                f'+COUNTIFS(Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY(),Daily_Log!B:B,"Saturday")*13'
-                f'+COUNTIFS(Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY(),Daily_Log!B:B,"Sunday")*13'
-                f'+COUNTIFS(Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY(),Daily_Log!O:O,">"&0)'
-                f'+COUNTIFS(Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY(),Daily_Log!P:P,">"&0)',
-                "",
-                "",
-            ],
-            ["Progresso", "=IF(B5>0,B4/B5,0)", "", ""],
-            # Linha 7: Vazia
-            ["", "", "", ""],
-            # Seção B: Hoje (Linhas 8-14)
-            ["HOJE", "", "", ""],
-            ["Data", "=TODAY()", "", ""],
-            [
-                "Pts Diários",
-                "=IFERROR(INDEX(Daily_Log!R:R,MATCH(TODAY(),Daily_Log!A:A,0)),0)",
-                "",
-                "",
-            ],
-            [
-                "Exercício",
-                "=IFERROR(INDEX(Daily_Log!S:S,MATCH(TODAY(),Daily_Log!A:A,0)),0)",
-                "",
-                "",
-            ],
-            ["Total", "=B10+B11", "", ""],
-            [
-                "Besteiras",
-                "=IFERROR(INDEX(Daily_Log!Q:Q,MATCH(TODAY(),Daily_Log!A:A,0)),0)",
-                "",
-                "",
-            ],
-            [
-                "Status",
-                '=IF(B12>=IF(WEEKDAY(TODAY(),2)>=6,13,15),"Perfeito",IF(B12>=10,"Bom","Atrasado"))',
-                "",
-                "",
-            ],
-            # Linha 15: Vazia
-            ["", "", "", ""],
-            # Seção C: Estatísticas (Linhas 16-22)
-            ["ESTATÍSTICAS", "", "", ""],
-            ["Total de Dias", "=COUNTA(Daily_Log!A:A)-1", "", ""],
-            [
-                "Dias Perfeitos",
-                "=COUNTIF(Daily_Log!R:R,15)"
-                '+COUNTIFS(Daily_Log!R:R,13,Daily_Log!B:B,"Saturday")'
-                '+COUNTIFS(Daily_Log!R:R,13,Daily_Log!B:B,"Sunday")',
-                "",
-                "",
-            ],
-            ["Média Pts Diários", "=IFERROR(AVERAGE(Daily_Log!T:T),0)", "", ""],
-            ["Total Besteiras", "=SUM(Daily_Log!Q:Q)", "", ""],
-            ["Melhor Semana", "=MAX(Weekly_Summary!L:L)", "", ""],
-            [
-                "Peso Atual",
-                '=IFERROR(INDEX(Config!B:B,MATCH("current_weight",Config!A:A,0)),"--")',
-                "",
-                "",
-            ],
-            # Linha 23: Vazia
-            ["", "", "", ""],
-            # Seção D: Semana por Categoria (Linhas 24-30)
-            ["SEMANA POR CATEGORIA", "", "", ""],
-            # Sono (C=acordar, M=quarto, N=cama)
-            [
-                "Sono",
-                f'=SUMIFS(Daily_Log!C:C,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())'
-                f'+SUMIFS(Daily_Log!M:M,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())'
-                f'+SUMIFS(Daily_Log!N:N,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())',
-                "/19",
-                "",
-            ],
-            # Nutrição
-            [
-                "Nutrição",
-                f'=SUMIFS(Daily_Log!E:E,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())'
-                f'+SUMIFS(Daily_Log!F:F,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())'
-                f'+SUMIFS(Daily_Log!G:G,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())'
-                f'+SUMIFS(Daily_Log!H:H,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())',
-                "/28",
-                "",
-            ],
-            # Hidratação (I=garrafa_1, J=garrafa_2*2, K=garrafa_3*3, L=copo_300ml)
-            [
-                "Hidratação",
-                f'=SUMIFS(Daily_Log!I:I,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())'
-                f'+SUMIFS(Daily_Log!J:J,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())*2'
-                f'+SUMIFS(Daily_Log!K:K,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())*3'
-                f'+SUMIFS(Daily_Log!L:L,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())',
-                "/49",
-                "",
-            ],
-            # Cardio (somente dias úteis, max 5)
-            [
-                "Cardio",
-                f'=SUMIFS(Daily_Log!D:D,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())',
-                "/5",
-                "",
-            ],
-            # Exercício (O=pilates, P=academia)
-            [
-                "Exercício",
-                f'=SUMIFS(Daily_Log!O:O,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())'
-                f'+SUMIFS(Daily_Log!P:P,Daily_Log!A:A,">="&{week_start},Daily_Log!A:A,"<="&TODAY())',
-                "/5",
-                "",
-            ],
-            # Total
-            ["TOTAL", "=SUM(B25:B29)", "/106", ""],
-        ]
-
         # Write all dashboard data
-        self.sheet.values().update(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_DASHBOARD}!A1",
-            valueInputOption="USER_ENTERED",
-            body={"values": dashboard_data},
-        ).execute()
+        self._write(
+            f"{config.SHEET_DASHBOARD}!A1",
+            [list(row) for row in _DASHBOARD_ROWS],
+            "USER_ENTERED",
+        )
 
         return True
 
     def setup_all_analysis_sheets(self) -> dict:
         """Set up Weekly_Summary, Monthly_Summary, and Dashboard sheets.
 
+        All three sheets are written with a single values.batchUpdate.
+
         Returns:
             Dictionary with status for each sheet.
         """
         results = {}
 
         try:
-            self.setup_weekly_summary_sheet()
-            results["weekly_summary"] = "success"
+            with self.batch_writes():
+                try:
+                    self.setup_weekly_summary_sheet()
+                    results["weekly_summary"] = "success"
+                except Exception as e:
+                    results["weekly_summary"] = f"error: {e}"
+
+                try:
+                    self.setup_monthly_summary_sheet()
+                    results["monthly_summary"] = "success"
+                except Exception as e:
+                    results["monthly_summary"] = f"error: {e}"
+
+                try:
+                    self.setup_dashboard_sheet()
+                    results["dashboard"] = "success"
+                except Exception as e:
+                    results["dashboard"] = f"error: {e}"
         except Exception as e:
-            results["weekly_summary"] = f"error: {e}"
-
-        try:
-            self.setup_monthly_summary_sheet()
-            results["monthly_summary"] = "success"
-        except Exception as e:
-            results["monthly_summary"] = f"error: {e}"
-
-        try:
-            self.setup_dashboard_sheet()
-            results["dashboard"] = "success"
-        except Exception as e:
-            results["dashboard"] = f"error: {e}"
+            # The shared write failed, so none of the sheets were written
+            for name, status in results.items():
+                if status == "success":
+                    results[name] = f"error: {e}"
 
         return results
 
@@ -742,51 +1139,13 @@ class SheetsClient:
         result = self.sheet.values().get(
             spreadsheetId=self.spreadsheet_id,
             range=f"{config.SHEET_WEEKLY_SUMMARY}!A:A",
-        ).execute()
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
         values = result.get("values", [])
         row_num = len(values) + 1
 
-        # Row formulas (same structure, just with different row number)
-        row_formulas = [
-            f"=ISOWEEKNUM(B{row_num})",  # A: week_num
-            start_date,  # B: start_date
-            f"=B{row_num}+6",  # C: end_date
-            gym_choice,  # D: gym_choice
-            # E: sleep_pts (C=wake, M=bedroom, N=bed)
-            f'=SUMIFS(Daily_Log!C:C,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-            f'+SUMIFS(Daily_Log!M:M,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-            f'+SUMIFS(Daily_Log!N:N,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-            # F: nutrition_pts
-            f'=SUMIFS(Daily_Log!E:E,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-            f'+SUMIFS(Daily_Log!F:F,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-            f'+SUMIFS(Daily_Log!G:G,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-            f'+SUMIFS(Daily_Log!H:H,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-            # G: hydration_pts (I=water_1, J=water_2*2, K=water_3*3, L=water_copo)
-            f'=SUMIFS(Daily_Log!I:I,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-            f'+SUMIFS(Daily_Log!J:J,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})*2'
-            f'+SUMIFS(Daily_Log!K:K,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})*3'
-            f'+SUMIFS(Daily_Log!L:L,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-            # H: cardio_pts
-            f'=SUMIFS(Daily_Log!D:D,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-            # I: exercise_pts (O=pilates, P=gym)
-            f'=SUMIFS(Daily_Log!O:O,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})'
-            f'+SUMIFS(Daily_Log!P:P,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-            f"=E{row_num}+F{row_num}+G{row_num}+H{row_num}+I{row_num}",  # J: raw_score
-            # K: cheat_penalty (Q=cheat_meals)
-            f'=SUMIFS(Daily_Log!Q:Q,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})*3',
-            f"=MAX(0,J{row_num}-K{row_num})",  # L: final_score
-            f"=L{row_num}/106",  # M: percentage
-            # N: status
-            f'=IF(M{row_num}>=1,"Perfeito",IF(M{row_num}>=0.85,"Sucesso",'
-            f'IF(M{row_num}>=0.7,"Precisa Melhorar","Perigo")))',
-        ]
+        row_formulas = _weekly_summary_row(row_num, start_date, gym_choice)
 
-        self.sheet.values().update(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_WEEKLY_SUMMARY}!A{row_num}",
-            valueInputOption="USER_ENTERED",
-            body={"values": [row_formulas]},
-        ).execute()
+        self._write(f"{config.SHEET_WEEKLY_SUMMARY}!A{row_num}", [row_formulas], "USER_ENTERED")
 
         return True
 
@@ -803,40 +1162,12 @@ class SheetsClient:
         result = self.sheet.values().get(
             spreadsheetId=self.spreadsheet_id,
             range=f"{config.SHEET_MONTHLY_SUMMARY}!A:A",
-        ).execute()
+        ).execute(num_retries=config.SHEETS_NUM_RETRIES)
         values = result.get("values", [])
         row_num = len(values) + 1
 
-        row_formulas = [
-            f'=TEXT(B{row_num},"YYYY-MM")',  # A: month
-            start_date,  # B: start_date
-            f"=EOMONTH(B{row_num},0)",  # C: end_date
-            # D: days_tracked
-            f'=COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-            # E: total_pts (T=total_pts)
-            f'=SUMIFS(Daily_Log!T:T,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-            # F: max_possible (O=pilates, P=gym)
-            f"=D{row_num}*15+SUMPRODUCT((Daily_Log!A:A>=B{row_num})*(Daily_Log!A:A<=C{row_num})"
-            "*(Daily_Log!O:O+Daily_Log!P:P>0))",
-            # G: cheat_meals (Q=cheat_meals)
-            f'=SUMIFS(Daily_Log!Q:Q,Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num})',
-            f"=G{row_num}*3",  # H: cheat_penalty
-            f"=MAX(0,E{row_num}-H{row_num})",  # I: final_score
-            f"=IF(D{row_num}>0,I{row_num}/D{row_num},0)",  # J: avg_daily
-            # K: perfect_days (R=daily_pts: 15 on weekdays, 13 on weekends)
-            f'=COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!R:R,15)'
-            f'+COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!R:R,13,Daily_Log!B:B,"Saturday")'
-            f'+COUNTIFS(Daily_Log!A:A,">="&B{row_num},Daily_Log!A:A,"<="&C{row_num},Daily_Log!R:R,13,Daily_Log!B:B,"Sunday")',
-            # L: status
-            f'=IF(J{row_num}>=15,"Perfeito",IF(J{row_num}>=12,"Excelente",'
-            f'IF(J{row_num}>=10,"Bom",IF(J{row_num}>=8,"Precisa Melhorar","Perigo"))))',
-        ]
+        row_formulas = _monthly_summary_row(row_num, start_date)
 
-        self.sheet.values().update(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{config.SHEET_MONTHLY_SUMMARY}!A{row_num}",
-            valueInputOption="USER_ENTERED",
-            body={"values": [row_formulas]},
-        ).execute()
+        self._write(f"{config.SHEET_MONTHLY_SUMMARY}!A{row_num}", [row_formulas], "USER_ENTERED")
 
         return True
@@ -1,5 +1,7 @@
 import os
 import json
+from types import MappingProxyType
+from typing import Mapping
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -32,6 +34,35 @@ def get_google_credentials():
 # Timezone
 TIMEZONE = "America/Sao_Paulo"
 
+# Maximum number of updates processed at the same time
+CONCURRENT_UPDATES = 32
+
+# HTTP connections to the Telegram API shared by handlers and jobs, and
+# seconds to wait for a free one before giving up
+TELEGRAM_POOL_SIZE = 256
+TELEGRAM_POOL_TIMEOUT = 30.0
+
+# Seconds Telegram holds a getUpdates long-poll open when idle
+POLLING_TIMEOUT = 30
+
+# Seconds to keep cached reads of today's row, the gym day choice and
+# the Config sheet
+SHEETS_CACHE_TTL = 300
+
+# Worker threads (each with its own connection) for Sheets API calls, and
+# seconds before a stalled Sheets request is abandoned
+SHEETS_MAX_CONNECTIONS = 8
+SHEETS_HTTP_TIMEOUT = 30
+
+# Times a Sheets request is retried, with exponential backoff and jitter,
+# after a rate limit (429) or server error (5xx)
+SHEETS_NUM_RETRIES = 5
+
+# Queued action writes are sent together every interval (seconds) or
+# as soon as this many are waiting, whichever comes first
+SHEETS_WRITE_FLUSH_INTERVAL = 0.5
+SHEETS_WRITE_BATCH_SIZE = 10
+
 # Sheet names
 SHEET_DAILY_LOG = "Daily_Log"
 SHEET_MEALS_LOG = "Meals_Log"
@@ -65,7 +96,7 @@ DAILY_COLUMNS = {
 }
 
 # Points configuration
-POINTS = {
+POINTS: Mapping[str, int] = MappingProxyType({
     "wake_7am": 1,
     "cardio": 1,
     "breakfast": 1,
@@ -80,7 +111,7 @@ POINTS = {
     "bed": 1,
     "pilates": 1,
     "gym": 1,
-}
+})
 
 # Max daily points (excluding exercise which varies by day)
 # Weekday: wake + cardio + 4 meals + 3 water (6 pts) + copo (1 pt) + bedroom + bed = 15
@@ -98,8 +129,7 @@ SCHEDULE = {
     "hydration_check": "14:00",
     "snack": "16:00",
     "exercise": "18:00",
-    "dinner": "19:00",
-    "water_warning": "19:00",
+    "dinner": "19:00",  # Followed by the water warning when behind
     "chores": "21:30",
     "bedroom": "22:00",
     "bed": "22:30",